@@ -1,17 +1,67 @@
 import asyncio
+import contextlib
+import hashlib
 import logging
-from datetime import timedelta, datetime
+import random
+import time
+from datetime import timedelta
+from urllib.parse import urlencode
 
 import aiohttp
 import async_timeout
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, CONF_URL, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.components import webhook
+from homeassistant.const import (
+    CONF_API_KEY,
+    CONF_URL,
+    CONF_WEBHOOK_ID,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import HomeAssistant, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_loads
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import DOMAIN
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    ATTRIBUTE_MODE_SUMMARY,
+    CONF_ATTRIBUTE_MODE,
+    CONF_CATEGORY_EXCLUDE,
+    CONF_CATEGORY_NAMES,
+    CONF_CATEGORY_PREFIXES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PUSH_ENABLED,
+    CONF_SERVER_FILTER,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PUSH_ENABLED,
+    DEFAULT_SERVER_FILTER,
+    DOMAIN,
+    EVENT_DOCUMENT_CHANGED,
+    EVENT_DOCUMENT_REMOVED,
+    EVENT_ITEM_ADDED,
+    EVENT_ITEM_COMPLETED,
+    EVENT_TASK_ITEM_MOVED,
+    HA_CATEGORY,
+)
+from .helpers import (
+    apply_item_mutation,
+    compute_item_stats,
+    diff_items,
+    document_fingerprint,
+    CategoryMatcher,
+    flatten_items,
+    get_flat_items,
+    get_item,
+    split_categories,
+    window_items,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,59 +69,263 @@ PLATFORMS = [Platform.SENSOR]
 
 SCAN_INTERVAL = timedelta(minutes=5)
 
+REFRESH_WINDOW = 1.0
+REFRESH_MAX_WAIT = 5.0
+REFRESH_MAX_DOCUMENTS = 3
+
+MUTATION_COALESCE_DELAY = 0.1
+MUTATION_CONCURRENCY = 2
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+CONNECTION_LIMIT_PER_HOST = 4
+CONNECTION_KEEPALIVE = 60
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 5.0
+IDEMPOTENT_METHODS = {"GET", "PUT"}
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 60.0
+
+# Above these sizes parsing and stats run in the executor instead of on the event loop.
+EXECUTOR_BODY_THRESHOLD = 256 * 1024
+EXECUTOR_ITEM_THRESHOLD = 2000
+
+# Cap on typed item/removal events per refresh; jotty_document_changed is not capped.
+MAX_EVENTS_PER_REFRESH = 25
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    url = entry.data[CONF_URL]
-    api_key = entry.data[CONF_API_KEY]
+    session = _async_create_session()
+
+    async def async_close_session(_event=None):
+        await session.close()
 
-    session = async_get_clientsession(hass)
-    client = JottyClient(session, url, api_key)
+    # Entries are not unloaded on shutdown, so close the session explicitly.
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session))
 
     try:
-        await client.test_connection()
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Jotty: %s", err)
-        raise ConfigEntryNotReady from err
+        return await _async_setup_entry(hass, entry, session)
+    except Exception:
+        entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if entry_data:
+            entry_data["mutation_queue"].async_shutdown()
+            entry_data["refresh_scheduler"].async_shutdown()
+        await session.close()
+        raise
+
 
-    coordinator = JottyDataUpdateCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
+async def _async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, session: aiohttp.ClientSession) -> bool:
+    url = entry.data[CONF_URL]
+    api_key = entry.data[CONF_API_KEY]
+
+    category_matcher = CategoryMatcher(
+        prefixes=split_categories(entry.options.get(CONF_CATEGORY_PREFIXES, [HA_CATEGORY])),
+        names=split_categories(entry.options.get(CONF_CATEGORY_NAMES, [])),
+        exclude=split_categories(entry.options.get(CONF_CATEGORY_EXCLUDE, [])),
+    )
+    server_filter = entry.options.get(CONF_SERVER_FILTER, DEFAULT_SERVER_FILTER)
+
+    client = JottyClient(
+        session,
+        url,
+        api_key,
+        document_filter=category_matcher,
+        server_categories=category_matcher.server_categories if server_filter else None,
+        executor=hass.async_add_executor_job,
+    )
+
+    push_enabled = entry.options.get(CONF_PUSH_ENABLED, DEFAULT_PUSH_ENABLED)
+    max_interval = entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+    # With push updates polling is only a safety net, so stay at the slow end.
+    min_interval = max_interval if push_enabled else entry.options.get(
+        CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+    )
+
+    coordinator = JottyDataUpdateCoordinator(
+        hass,
+        client,
+        category_matcher,
+        Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"),
+        min_interval=min_interval,
+        max_interval=max_interval,
+        build_flat_items=entry.options.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE) != ATTRIBUTE_MODE_SUMMARY,
+    )
+
+    # With a cached snapshot entities come up immediately and Jotty is
+    # refreshed in the background once setup is done. Otherwise the first
+    # refresh doubles as the connectivity check: it only fails when every
+    # endpoint fails, which raises ConfigEntryNotReady.
+    restored = await coordinator.async_restore()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+
+    mutation_queue = JottyMutationQueue(hass)
+    refresh_scheduler = JottyRefreshScheduler(hass, coordinator)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
+        "session": session,
         "client": client,
         "coordinator": coordinator,
+        "mutation_queue": mutation_queue,
+        "refresh_scheduler": refresh_scheduler,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    await async_setup_services(hass, client, coordinator)
+    await async_setup_services(hass, client, coordinator, mutation_queue, refresh_scheduler)
+
+    if push_enabled:
+        _async_setup_webhook(hass, entry, coordinator, refresh_scheduler)
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    if restored:
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN} startup refresh")
 
     return True
 
 
+def _async_create_session() -> aiohttp.ClientSession:
+    """Create the pooled HTTP session owned by a config entry.
+
+    Jotty is usually a small self-hosted box, so connections are kept alive
+    between requests and capped per host instead of sharing Home Assistant's
+    global session.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=CONNECTION_KEEPALIVE,
+        ssl=ssl_util.get_default_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
+PUSH_KINDS = {
+    "checklist": "checklists",
+    "checklists": "checklists",
+    "list": "checklists",
+    "note": "notes",
+    "notes": "notes",
+    "task": "tasks",
+    "tasks": "tasks",
+}
+
+
+def _async_setup_webhook(hass: HomeAssistant, entry: ConfigEntry, coordinator, refresh_scheduler):
+    """Register the webhook Jotty can call to push change notifications."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if not webhook_id:
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id})
+
+    async def handle_webhook(hass, webhook_id, request):
+        try:
+            payload = await request.json()
+        except ValueError:
+            payload = None
+        _LOGGER.debug("Push notification received: %s", payload)
+        _async_handle_push(coordinator, refresh_scheduler, payload)
+
+    webhook.async_register(hass, DOMAIN, "Jotty", webhook_id, handle_webhook, local_only=True)
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
+    _LOGGER.info("Jotty push webhook available at %s", webhook.async_generate_path(webhook_id))
+
+
+@callback
+def _async_handle_push(coordinator, refresh_scheduler, payload):
+    """Turn a push notification into a targeted refresh, or a full one if it is not understood.
+
+    Accepts {"type": "checklist", "id": "...", "action": "deleted"} style
+    payloads, optionally wrapped in a "data" object.
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
+        payload = {**payload, **payload["data"]}
+    if not isinstance(payload, dict):
+        refresh_scheduler.async_schedule()
+        return
+
+    kind = PUSH_KINDS.get(str(payload.get("type", "")).lower())
+    document_id = payload.get("id")
+    if kind is None or not document_id:
+        refresh_scheduler.async_schedule()
+        return
+
+    action = str(payload.get("action", payload.get("event", ""))).lower()
+    if "delete" in action:
+        coordinator.async_remove_document(kind, document_id)
+    else:
+        refresh_scheduler.async_schedule(kind, document_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data["mutation_queue"].async_shutdown()
+        entry_data["refresh_scheduler"].async_shutdown()
+        await entry_data["session"].close()
 
     return unload_ok
 
 
-async def async_setup_services(hass: HomeAssistant, client, coordinator):
-    
-    last_refresh = {"time": datetime.min}
+GET_ITEMS_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Exclusive("checklist_id", "document"): cv.string,
+        vol.Exclusive("task_id", "document"): cv.string,
+        vol.Optional("offset", default=0): cv.positive_int,
+        vol.Optional("limit"): cv.positive_int,
+        vol.Optional("status"): cv.string,
+        vol.Optional("search"): cv.string,
+    }),
+    cv.has_at_least_one_key("checklist_id", "task_id"),
+)
+
+
+async def async_setup_services(hass: HomeAssistant, client, coordinator, mutation_queue, refresh_scheduler):
     
     def schedule_smart_refresh():
-        now = datetime.now()
-        if (now - last_refresh["time"]).total_seconds() > 0.5:
-            last_refresh["time"] = now
-            hass.async_create_task(coordinator.async_request_refresh())
+        refresh_scheduler.async_schedule()
+
+    def schedule_document_refresh(kind, document_id):
+        refresh_scheduler.async_schedule(kind, document_id)
+
+    def rollback_optimistic(kind, document_id, token):
+        # The refresh issued when the mutation queue drains reconciles the rest.
+        if token is not None:
+            coordinator.async_rollback_optimistic(kind, document_id, token)
+
+    def handle_queue_drained(documents):
+        for kind, document_id in documents:
+            schedule_document_refresh(kind, document_id)
+
+    mutation_queue.on_drain = handle_queue_drained
+
+    def item_value(kind, document_id, item_index, field, default=None):
+        document = (coordinator.data or {}).get(f"{kind}_by_id", {}).get(document_id)
+        item = get_item(document, item_index) if document else None
+        return item.get(field, default) if item else None
     
     async def handle_create_note(call):
         title = call.data.get("title")
         content = call.data.get("content", "")
-        category = "Home Assistant"
+        category = coordinator.category_matcher.default_category
         
         _LOGGER.debug("Creating note: title=%s", title)
         try:
@@ -86,13 +340,13 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         note_id = call.data.get("note_id")
         title = call.data.get("title")
         content = call.data.get("content")
-        category = "Home Assistant"
+        category = call.data.get("category")
         
         _LOGGER.debug("Updating note: note_id=%s, title=%s", note_id, title)
         try:
             result = await client.update_note(note_id, title, content, category)
             _LOGGER.debug("Update note result: %s", result)
-            schedule_smart_refresh()
+            schedule_document_refresh("notes", note_id)
         except Exception as err:
             _LOGGER.error("Failed to update note: %s", err)
             raise
@@ -104,14 +358,14 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         try:
             result = await client.delete_note(note_id)
             _LOGGER.debug("Delete note result: %s", result)
-            schedule_smart_refresh()
+            coordinator.async_remove_document("notes", note_id)
         except Exception as err:
             _LOGGER.error("Failed to delete note: %s", err)
             raise
     
     async def handle_create_checklist(call):
         title = call.data.get("title")
-        category = "Home Assistant"
+        category = coordinator.category_matcher.default_category
         list_type = call.data.get("type", "simple")
         
         _LOGGER.debug("Creating checklist: title=%s, type=%s", title, list_type)
@@ -126,13 +380,13 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
     async def handle_update_checklist(call):
         checklist_id = call.data.get("checklist_id")
         title = call.data.get("title")
-        category = call.data.get("category", "Home Assistant")
+        category = call.data.get("category")
         
         _LOGGER.debug("Updating checklist: checklist_id=%s, title=%s", checklist_id, title)
         try:
             result = await client.update_checklist(checklist_id, title, category)
             _LOGGER.debug("Update checklist result: %s", result)
-            schedule_smart_refresh()
+            schedule_document_refresh("checklists", checklist_id)
         except Exception as err:
             _LOGGER.error("Failed to update checklist: %s", err)
             raise
@@ -145,12 +399,18 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         
         _LOGGER.debug("Adding checklist item: checklist_id=%s, text=%s, status=%s, parent_index=%s", 
                      checklist_id, text, status, parent_index)
+        token = coordinator.async_apply_optimistic(
+            "checklists", checklist_id, "add", parent_index, text=text, status=status
+        )
         try:
-            result = await client.add_checklist_item(checklist_id, text, status, parent_index)
+            result = await mutation_queue.async_submit(
+                "checklists", checklist_id,
+                lambda: client.add_checklist_item(checklist_id, text, status, parent_index),
+            )
             _LOGGER.debug("Add checklist item result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to add checklist item: %s", err)
+            rollback_optimistic("checklists", checklist_id, token)
             raise
     
     async def handle_check_item(call):
@@ -159,12 +419,18 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         
         _LOGGER.debug("Checking item: checklist_id=%s, item_index=%s (type: %s)", 
                      checklist_id, item_index, type(item_index).__name__)
+        baseline = item_value("checklists", checklist_id, item_index, "completed", False)
+        token = coordinator.async_apply_optimistic("checklists", checklist_id, "check", item_index)
         try:
-            result = await client.check_item(checklist_id, item_index)
+            result = await mutation_queue.async_submit(
+                "checklists", checklist_id,
+                lambda: client.check_item(checklist_id, item_index),
+                key=("completed", str(item_index).strip()), value=True, baseline=baseline,
+            )
             _LOGGER.debug("Check item result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to check item: %s", err)
+            rollback_optimistic("checklists", checklist_id, token)
             raise
     
     async def handle_uncheck_item(call):
@@ -173,12 +439,18 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         
         _LOGGER.debug("Unchecking item: checklist_id=%s, item_index=%s (type: %s)", 
                      checklist_id, item_index, type(item_index).__name__)
+        baseline = item_value("checklists", checklist_id, item_index, "completed", False)
+        token = coordinator.async_apply_optimistic("checklists", checklist_id, "uncheck", item_index)
         try:
-            result = await client.uncheck_item(checklist_id, item_index)
+            result = await mutation_queue.async_submit(
+                "checklists", checklist_id,
+                lambda: client.uncheck_item(checklist_id, item_index),
+                key=("completed", str(item_index).strip()), value=False, baseline=baseline,
+            )
             _LOGGER.debug("Uncheck item result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to uncheck item: %s", err)
+            rollback_optimistic("checklists", checklist_id, token)
             raise
     
     async def handle_delete_checklist_item(call):
@@ -186,12 +458,16 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         item_index = call.data.get("item_index")
         
         _LOGGER.debug("Deleting checklist item: checklist_id=%s, item_index=%s", checklist_id, item_index)
+        token = coordinator.async_apply_optimistic("checklists", checklist_id, "delete", item_index)
         try:
-            result = await client.delete_checklist_item(checklist_id, item_index)
+            result = await mutation_queue.async_submit(
+                "checklists", checklist_id,
+                lambda: client.delete_checklist_item(checklist_id, item_index),
+            )
             _LOGGER.debug("Delete checklist item result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to delete checklist item: %s", err)
+            rollback_optimistic("checklists", checklist_id, token)
             raise
     
     async def handle_delete_checklist(call):
@@ -201,14 +477,14 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         try:
             result = await client.delete_checklist(checklist_id)
             _LOGGER.debug("Delete checklist result: %s", result)
-            schedule_smart_refresh()
+            coordinator.async_remove_document("checklists", checklist_id)
         except Exception as err:
             _LOGGER.error("Failed to delete checklist: %s", err)
             raise
 
     async def handle_create_task(call):
         title = call.data.get("title")
-        category = "Home Assistant"
+        category = coordinator.category_matcher.default_category
         
         _LOGGER.debug("Creating task: title=%s", title)
         try:
@@ -222,13 +498,13 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
     async def handle_update_task(call):
         task_id = call.data.get("task_id")
         title = call.data.get("title")
-        category = call.data.get("category", "Home Assistant")
+        category = call.data.get("category")
         
         _LOGGER.debug("Updating task: task_id=%s, title=%s", task_id, title)
         try:
             result = await client.update_task(task_id, title, category)
             _LOGGER.debug("Update task result: %s", result)
-            schedule_smart_refresh()
+            schedule_document_refresh("tasks", task_id)
         except Exception as err:
             _LOGGER.error("Failed to update task: %s", err)
             raise
@@ -240,7 +516,7 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         try:
             result = await client.delete_task(task_id)
             _LOGGER.debug("Delete task result: %s", result)
-            schedule_smart_refresh()
+            coordinator.async_remove_document("tasks", task_id)
         except Exception as err:
             _LOGGER.error("Failed to delete task: %s", err)
             raise
@@ -253,12 +529,18 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         
         _LOGGER.debug("Adding task item: task_id=%s, text=%s, status=%s, parent_index=%s", 
                      task_id, text, status, parent_index)
+        token = coordinator.async_apply_optimistic(
+            "tasks", task_id, "add", parent_index, text=text, status=status
+        )
         try:
-            result = await client.add_task_item(task_id, text, status, parent_index)
+            result = await mutation_queue.async_submit(
+                "tasks", task_id,
+                lambda: client.add_task_item(task_id, text, status, parent_index),
+            )
             _LOGGER.debug("Add task item result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to add task item: %s", err)
+            rollback_optimistic("tasks", task_id, token)
             raise
 
     async def handle_update_task_item_status(call):
@@ -268,12 +550,20 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         
         _LOGGER.debug("Updating task item status: task_id=%s, item_index=%s, status=%s", 
                      task_id, item_index, status)
+        baseline = item_value("tasks", task_id, item_index, "status")
+        token = coordinator.async_apply_optimistic(
+            "tasks", task_id, "set_status", item_index, status=status
+        )
         try:
-            result = await client.update_task_item_status(task_id, item_index, status)
+            result = await mutation_queue.async_submit(
+                "tasks", task_id,
+                lambda: client.update_task_item_status(task_id, item_index, status),
+                key=("status", str(item_index).strip()), value=status, baseline=baseline,
+            )
             _LOGGER.debug("Update task item status result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to update task item status: %s", err)
+            rollback_optimistic("tasks", task_id, token)
             raise
 
     async def handle_delete_task_item(call):
@@ -281,12 +571,16 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         item_index = call.data.get("item_index")
         
         _LOGGER.debug("Deleting task item: task_id=%s, item_index=%s", task_id, item_index)
+        token = coordinator.async_apply_optimistic("tasks", task_id, "delete", item_index)
         try:
-            result = await client.delete_task_item(task_id, item_index)
+            result = await mutation_queue.async_submit(
+                "tasks", task_id,
+                lambda: client.delete_task_item(task_id, item_index),
+            )
             _LOGGER.debug("Delete task item result: %s", result)
-            schedule_smart_refresh()
         except Exception as err:
             _LOGGER.error("Failed to delete task item: %s", err)
+            rollback_optimistic("tasks", task_id, token)
             raise
 
     async def handle_get_task_statuses(call):
@@ -301,6 +595,36 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
             _LOGGER.error("Failed to get task statuses: %s", err)
             raise
 
+    async def handle_get_items(call):
+        offset = call.data["offset"]
+        limit = call.data.get("limit")
+
+        if "checklist_id" in call.data:
+            kind, document_id, stats_key = "checklist_id", call.data["checklist_id"], "checklist_stats"
+        else:
+            kind, document_id, stats_key = "task_id", call.data["task_id"], "task_stats"
+
+        stats = (coordinator.data or {}).get(stats_key, {}).get(document_id)
+        if stats is None:
+            raise ServiceValidationError(f"No synced Jotty list with id {document_id}")
+
+        matched, items = window_items(
+            get_flat_items(stats),
+            offset=offset,
+            limit=limit,
+            status=call.data.get("status"),
+            search=call.data.get("search"),
+        )
+        _LOGGER.debug("Get items: %s=%s offset=%s limit=%s matched=%s", kind, document_id, offset, limit, matched)
+        return {
+            kind: document_id,
+            "total": stats["total"],
+            "matched": matched,
+            "offset": offset,
+            "limit": limit,
+            "items": items,
+        }
+
     async def handle_create_task_status(call):
         task_id = call.data.get("task_id")
         status_id = call.data.get("status_id")
@@ -313,7 +637,7 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         try:
             result = await client.create_task_status(task_id, status_id, label, color, order)
             _LOGGER.debug("Create task status result: %s", result)
-            schedule_smart_refresh()
+            schedule_document_refresh("tasks", task_id)
         except Exception as err:
             _LOGGER.error("Failed to create task status: %s", err)
             raise
@@ -329,7 +653,7 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         try:
             result = await client.update_task_status(task_id, status_id, label, color, order)
             _LOGGER.debug("Update task status result: %s", result)
-            schedule_smart_refresh()
+            schedule_document_refresh("tasks", task_id)
         except Exception as err:
             _LOGGER.error("Failed to update task status: %s", err)
             raise
@@ -342,7 +666,7 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
         try:
             result = await client.delete_task_status(task_id, status_id)
             _LOGGER.debug("Delete task status result: %s", result)
-            schedule_smart_refresh()
+            schedule_document_refresh("tasks", task_id)
         except Exception as err:
             _LOGGER.error("Failed to delete task status: %s", err)
             raise
@@ -364,18 +688,65 @@ async def async_setup_services(hass: HomeAssistant, client, coordinator):
     hass.services.async_register(DOMAIN, "update_task_item_status", handle_update_task_item_status)
     hass.services.async_register(DOMAIN, "delete_task_item", handle_delete_task_item)
     hass.services.async_register(DOMAIN, "get_task_statuses", handle_get_task_statuses)
+    hass.services.async_register(
+        DOMAIN,
+        "get_items",
+        handle_get_items,
+        schema=GET_ITEMS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     hass.services.async_register(DOMAIN, "create_task_status", handle_create_task_status)
     hass.services.async_register(DOMAIN, "update_task_status", handle_update_task_status)
     hass.services.async_register(DOMAIN, "delete_task_status", handle_delete_task_status)
 
 
+class CircuitOpenError(UpdateFailed):
+    """Raised instead of sending a request while Jotty is considered unhealthy."""
+
+
+def _is_transient_error(err) -> bool:
+    """Return True for failures worth retrying: timeouts, connection errors and 5xx/429.
+
+    An open circuit counts as transient too.
+    """
+    while err is not None:
+        if isinstance(err, CircuitOpenError):
+            return True
+        if isinstance(err, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+            return True
+        if isinstance(err, aiohttp.ClientResponseError):
+            return err.status >= 500 or err.status == 429
+        err = err.__cause__
+    return False
+
+
+def _is_auth_error(err) -> bool:
+    """Return True when Jotty refused the request with 401 or 403."""
+    while err is not None:
+        if isinstance(err, aiohttp.ClientResponseError):
+            return err.status in (401, 403)
+        err = err.__cause__
+    return False
+
+
 class JottyClient:
 
-    def __init__(self, session: aiohttp.ClientSession, url: str, api_key: str):
+    def __init__(self, session: aiohttp.ClientSession, url: str, api_key: str,
+                 document_filter=None, server_categories=None,
+                 mutation_concurrency: int = MUTATION_CONCURRENCY, executor=None):
         self.session = session
         self.url = url.rstrip("/")
         self.api_key = api_key
         self.headers = {"x-api-key": api_key, "Content-Type": "application/json"}
+        self.document_filter = document_filter
+        self.server_categories = server_categories
+        # Called as executor(func, *args) to parse large bodies off the event loop.
+        self._executor = executor
+        self._conditional_cache = {}
+        self._mutation_semaphore = asyncio.Semaphore(mutation_concurrency)
+        self._consecutive_failures = 0
+        self._circuit_open_until = None
+        self._probe_in_flight = False
 
     async def _make_request(self, method: str, endpoint: str, json_data: dict = None, include_content_type: bool = True):
         """Make an HTTP request with proper error handling and logging."""
@@ -388,8 +759,11 @@ class JottyClient:
         
         _LOGGER.debug("Making %s request to %s with data: %s", method, url, json_data)
         
-        try:
-            async with async_timeout.timeout(30):
+        # Cap concurrent writes; the timeout only starts once a slot is free.
+        limiter = contextlib.nullcontext() if method == "GET" else self._mutation_semaphore
+
+        async def send():
+            async with limiter, async_timeout.timeout(30):
                 if method == "GET":
                     async with self.session.get(url, headers=headers) as response:
                         return await self._handle_response(response, url)
@@ -406,6 +780,9 @@ class JottyClient:
                 elif method == "DELETE":
                     async with self.session.delete(url, headers=headers) as response:
                         return await self._handle_response(response, url)
+
+        try:
+            return await self._call_with_retry(method, send)
         except asyncio.TimeoutError:
             _LOGGER.error("Request to %s timed out", url)
             raise
@@ -413,68 +790,188 @@ class JottyClient:
             _LOGGER.error("Request to %s failed: %s", url, err)
             raise
 
+    @property
+    def circuit_open(self) -> bool:
+        """True while Jotty is considered unhealthy and requests are short-circuited."""
+        return self._circuit_open_until is not None and time.monotonic() < self._circuit_open_until
+
+    async def _call_with_retry(self, method: str, request):
+        """Run request() behind the circuit breaker.
+
+        Idempotent methods are retried on timeouts, connection errors and 5xx
+        responses with jittered exponential backoff. A request that still fails
+        once its retries are used up counts as one failure. After
+        CIRCUIT_FAILURE_THRESHOLD consecutive failed requests the circuit opens
+        and requests fail fast for CIRCUIT_COOLDOWN seconds. After the cooldown
+        a single request, sent without retries, probes whether Jotty has
+        recovered while the others keep failing fast.
+        """
+        if self.circuit_open:
+            raise CircuitOpenError("Jotty is unavailable, not sending request")
+
+        probe = self._consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD
+        if probe:
+            if self._probe_in_flight:
+                raise CircuitOpenError("Jotty is being probed, not sending request")
+            self._probe_in_flight = True
+
+        try:
+            attempts = RETRY_ATTEMPTS if method in IDEMPOTENT_METHODS and not probe else 1
+            for attempt in range(attempts):
+                try:
+                    result = await request()
+                except Exception as err:
+                    if not _is_transient_error(err):
+                        raise
+                    if attempt + 1 >= attempts or self.circuit_open:
+                        self._record_failure()
+                        raise
+                    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                    _LOGGER.debug("%s request failed (%s), retrying in %.2fs", method, err, delay)
+                    await asyncio.sleep(delay)
+                else:
+                    self._consecutive_failures = 0
+                    self._circuit_open_until = None
+                    return result
+        finally:
+            if probe:
+                self._probe_in_flight = False
+
+    def _record_failure(self):
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            if not self.circuit_open:
+                _LOGGER.warning(
+                    "Jotty failed %s times in a row, pausing requests for %ss",
+                    self._consecutive_failures, CIRCUIT_COOLDOWN,
+                )
+            self._circuit_open_until = time.monotonic() + CIRCUIT_COOLDOWN
+
+    async def _get_json(self, endpoint: str, description: str):
+        async def fetch():
+            async with async_timeout.timeout(10):
+                async with self.session.get(f"{self.url}{endpoint}", headers=self.headers) as response:
+                    response.raise_for_status()
+                    return await response.read()
+
+        try:
+            body = await self._call_with_retry("GET", fetch)
+            return await self._async_decode(body)
+        except (aiohttp.ClientError, ValueError) as err:
+            raise UpdateFailed(f"Error fetching {description}: {err}") from err
+
     async def _handle_response(self, response, url):
         """Handle the HTTP response."""
-        response_text = await response.text()
-        _LOGGER.debug("Response from %s: status=%s, body=%s", url, response.status, response_text[:500])
+        body = await response.read()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Response from %s: status=%s, body=%s",
+                url, response.status, body[:500].decode("utf-8", errors="replace"),
+            )
         
         if response.status >= 400:
-            _LOGGER.error("HTTP error %s from %s: %s", response.status, url, response_text)
+            _LOGGER.error("HTTP error %s from %s: %s", response.status, url, body.decode("utf-8", errors="replace"))
             response.raise_for_status()
         
+        if not body:
+            return {"success": True}
         try:
-            return await response.json() if response_text else {"success": True}
-        except:
+            return self._decode_documents(body, None)
+        except ValueError:
             _LOGGER.debug("Response is not JSON, returning raw text")
-            return {"success": True, "raw": response_text}
+            return {"success": True, "raw": body.decode("utf-8", errors="replace")}
+
+    async def _get_conditional(self, endpoint: str, description: str, documents_key: str = None):
+        """GET an endpoint, reusing the previous parsed payload when it has not changed.
+
+        ETag / Last-Modified validators are replayed as conditional headers and a
+        304 returns the cached object. Servers that send no validators are covered
+        by comparing a hash of the raw body, which skips JSON parsing as well.
+        Callers can detect an unchanged payload by identity.
+
+        For document endpoints (documents_key set) the payload is reduced to the
+        documents accepted by document_filter before it is cached, so documents
+        outside the synced categories are not kept in memory between polls.
+        When server_categories is set they are also sent as category query
+        parameters for servers that filter on their side.
+        """
+        if documents_key and self.server_categories:
+            endpoint = f"{endpoint}?{urlencode([('category', c) for c in self.server_categories])}"
+
+        cached = self._conditional_cache.get(endpoint)
+        headers = self.headers.copy()
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        async def fetch():
+            async with async_timeout.timeout(10):
+                async with self.session.get(f"{self.url}{endpoint}", headers=headers) as response:
+                    if response.status == 304 and cached:
+                        return None, None, None
+                    response.raise_for_status()
+                    return (
+                        await response.read(),
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
 
-    async def test_connection(self):
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/health"
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"Health check failed with status {response.status}")
-                    return await response.json()
+            body, etag, last_modified = await self._call_with_retry("GET", fetch)
         except aiohttp.ClientError as err:
-            raise Exception(f"Connection error: {err}") from err
+            raise UpdateFailed(f"Error fetching {description}: {err}") from err
+
+        if body is None:
+            _LOGGER.debug("%s not modified (304)", endpoint)
+            return cached["data"]
+
+        digest = hashlib.sha1(body).digest()
+        if cached and cached["digest"] == digest:
+            _LOGGER.debug("%s unchanged (content hash match)", endpoint)
+            data = cached["data"]
+        else:
+            data = await self._async_decode(body, documents_key)
+
+        self._conditional_cache[endpoint] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "digest": digest,
+            "data": data,
+        }
+        return data
+
+    async def _async_decode(self, body, documents_key=None):
+        """Decode a raw response body, in the executor when it is large."""
+        if self._executor is not None and len(body) >= EXECUTOR_BODY_THRESHOLD:
+            return await self._executor(self._decode_documents, body, documents_key)
+        return self._decode_documents(body, documents_key)
+
+    def _decode_documents(self, body, documents_key):
+        """Parse a response body and drop documents outside the synced categories.
+
+        This is the client's only JSON decode path; json_loads is orjson.
+        """
+        data = json_loads(body)
+        if documents_key and self.document_filter is not None and isinstance(data, dict):
+            data = {
+                **data,
+                documents_key: [d for d in data.get(documents_key, []) if self.document_filter(d)],
+            }
+        return data
 
     async def get_summary(self):
-        try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/summary",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error fetching summary: {err}") from err
+        return await self._get_conditional("/api/summary", "summary")
 
     async def get_checklists(self):
-        try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/checklists",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error fetching checklists: {err}") from err
+        return await self._get_conditional("/api/checklists", "checklists", "checklists")
 
     async def get_notes(self):
-        try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/notes",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error fetching notes: {err}") from err
+        return await self._get_conditional("/api/notes", "notes", "notes")
+
+    async def get_note(self, note_id: str):
+        return await self._get_json(f"/api/notes/{note_id}", "note")
 
     async def create_note(self, title: str, content: str = "", category: str = "Uncategorized"):
         data = {"title": title, "content": content, "category": category}
@@ -493,6 +990,9 @@ class JottyClient:
     async def delete_note(self, note_id: str):
         return await self._make_request("DELETE", f"/api/notes/{note_id}")
 
+    async def get_checklist(self, checklist_id: str):
+        return await self._get_json(f"/api/checklists/{checklist_id}", "checklist")
+
     async def create_checklist(self, title: str, category: str = "Uncategorized", list_type: str = "simple"):
         data = {"title": title, "category": category, "type": list_type}
         return await self._make_request("POST", "/api/checklists", data)
@@ -538,28 +1038,10 @@ class JottyClient:
         return await self._make_request("DELETE", f"/api/checklists/{checklist_id}")
 
     async def get_tasks(self):
-        try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/tasks",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error fetching tasks: {err}") from err
+        return await self._get_conditional("/api/tasks", "tasks", "tasks")
 
     async def get_task(self, task_id: str):
-        try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/tasks/{task_id}",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error fetching task: {err}") from err
+        return await self._get_json(f"/api/tasks/{task_id}", "task")
 
     async def create_task(self, title: str, category: str = "Home Assistant"):
         data = {"title": title, "category": category}
@@ -596,14 +1078,8 @@ class JottyClient:
 
     async def get_task_statuses(self, task_id: str):
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(
-                    f"{self.url}/api/tasks/{task_id}/statuses",
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    return data.get("statuses", []) if isinstance(data, dict) else data
+            data = await self._get_json(f"/api/tasks/{task_id}/statuses", "task statuses")
+            return data.get("statuses", []) if isinstance(data, dict) else data
         except Exception as err:
             _LOGGER.debug("Error fetching task statuses for %s: %s", task_id, err)
             return []
@@ -630,18 +1106,229 @@ class JottyClient:
         return await self._make_request("DELETE", f"/api/tasks/{task_id}/statuses/{status_id}")
 
 
+class JottyMutationQueue:
+    """Per-document queue that coalesces rapid-fire item mutations.
+
+    Mutations are collected for a short window and then run in submission order
+    per document; JottyClient caps how many of them are in flight overall.
+    Mutations that carry a key (e.g. the completed flag of one item) replace an
+    earlier pending mutation with the same key, and are dropped entirely when
+    they set the value back to what it was before the first of them. Keyless
+    mutations (adds and deletes shift index paths) are never coalesced and act
+    as a barrier. on_drain is called once with the touched documents when the
+    queue runs empty.
+    """
+
+    def __init__(self, hass: HomeAssistant, delay: float = MUTATION_COALESCE_DELAY):
+        self.hass = hass
+        self.on_drain = None
+        self._delay = delay
+        self._pending = {}
+        self._locks = {}
+        self._touched = set()
+        self._running = 0
+        self._flush_handle = None
+
+    async def async_submit(self, kind, document_id, call, key=None, value=None, baseline=None):
+        """Queue a mutation and wait for its result."""
+        future = self.hass.loop.create_future()
+        operations = self._pending.setdefault((kind, document_id), [])
+        operation = {"call": call, "key": key, "value": value, "baseline": baseline, "future": future}
+
+        if key is not None:
+            for earlier in reversed(operations):
+                if earlier["key"] is None:
+                    break
+                if earlier["key"] == key:
+                    operations.remove(earlier)
+                    self._resolve(earlier["future"], {"success": True, "coalesced": True})
+                    if earlier["baseline"] is not None and value == earlier["baseline"]:
+                        _LOGGER.debug("Mutation %s on %s %s cancels out, skipping", key, kind, document_id)
+                        self._touched.add((kind, document_id))
+                        self._schedule_flush()
+                        return {"success": True, "coalesced": True}
+                    operation["baseline"] = earlier["baseline"]
+                    break
+
+        operations.append(operation)
+        self._schedule_flush()
+        return await future
+
+    @callback
+    def async_shutdown(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for operations in self._pending.values():
+            for operation in operations:
+                operation["future"].cancel()
+        self._pending = {}
+
+    def _schedule_flush(self):
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(self._delay, self._flush)
+
+    @callback
+    def _flush(self):
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for document, operations in pending.items():
+            if operations:
+                self._running += 1
+                self.hass.async_create_task(self._run_document(document, operations))
+        self._maybe_drained()
+
+    async def _run_document(self, document, operations):
+        lock = self._locks.setdefault(document, asyncio.Lock())
+        try:
+            async with lock:
+                for operation in operations:
+                    try:
+                        result = await operation["call"]()
+                    except Exception as err:
+                        if not operation["future"].done():
+                            operation["future"].set_exception(err)
+                    else:
+                        self._resolve(operation["future"], result)
+        finally:
+            self._touched.add(document)
+            self._running -= 1
+            self._maybe_drained()
+
+    @staticmethod
+    def _resolve(future, result):
+        if not future.done():
+            future.set_result(result)
+
+    def _maybe_drained(self):
+        if self._running or self._pending or self._flush_handle is not None or not self._touched:
+            return
+        touched, self._touched = self._touched, set()
+        if self.on_drain is not None:
+            self.on_drain(touched)
+
+
+class JottyRefreshScheduler:
+    """Debounced refresh scheduler shared by all service handlers.
+
+    The first request after a quiet period refreshes immediately (leading
+    edge). Requests that arrive within the window after a refresh are folded
+    into one trailing refresh, fired once the window passes without new
+    requests or at the latest max_wait after the first deferred request.
+    Document requests are served with targeted refreshes unless a full
+    refresh was asked for or too many documents are pending.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, window: float = REFRESH_WINDOW,
+                 max_wait: float = REFRESH_MAX_WAIT):
+        self.hass = hass
+        self.coordinator = coordinator
+        self._window = window
+        self._max_wait = max_wait
+        self._lock = asyncio.Lock()
+        self._pending_full = False
+        self._pending_documents = set()
+        self._deferred_since = None
+        self._timer = None
+        self._tasks = set()
+        self._shutdown = False
+
+    @callback
+    def async_schedule(self, kind=None, document_id=None):
+        """Request a full refresh, or a refresh of one document when kind is given."""
+        if self._shutdown:
+            return
+        if kind is None:
+            self._pending_full = True
+        else:
+            self._pending_documents.add((kind, document_id))
+
+        if self._timer is None:
+            self._fire()
+            return
+
+        now = self.hass.loop.time()
+        if self._deferred_since is None:
+            self._deferred_since = now
+        self._timer.cancel()
+        fire_at = min(now + self._window, self._deferred_since + self._max_wait)
+        self._timer = self.hass.loop.call_at(fire_at, self._on_timer)
+
+    @callback
+    def async_shutdown(self):
+        self._shutdown = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    @callback
+    def _on_timer(self):
+        self._timer = None
+        if self._pending_full or self._pending_documents:
+            self._fire()
+
+    @callback
+    def _fire(self):
+        full, documents = self._pending_full, self._pending_documents
+        self._pending_full = False
+        self._pending_documents = set()
+        self._deferred_since = None
+        self._timer = self.hass.loop.call_later(self._window, self._on_timer)
+
+        task = self.hass.async_create_task(self._async_refresh(full, documents))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_refresh(self, full, documents):
+        async with self._lock:
+            if full or len(documents) > REFRESH_MAX_DOCUMENTS:
+                await self.coordinator.async_refresh_requested()
+            else:
+                await asyncio.gather(*(
+                    self.coordinator.async_refresh_document(kind, document_id)
+                    for kind, document_id in documents
+                ))
+
+
 class JottyDataUpdateCoordinator(DataUpdateCoordinator):
 
-    def __init__(self, hass: HomeAssistant, client: JottyClient):
+    def __init__(self, hass: HomeAssistant, client: JottyClient, category_matcher: CategoryMatcher,
+                 store: Store, min_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+                 max_interval: int = DEFAULT_MAX_SCAN_INTERVAL, build_flat_items: bool = True):
+        self._min_interval = timedelta(seconds=min_interval)
+        self._max_interval = timedelta(seconds=max(min_interval, max_interval))
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=min(max(SCAN_INTERVAL, self._min_interval), self._max_interval),
         )
         self.client = client
+        self.category_matcher = category_matcher
+        self._store = store
+        self._checklist_stats = {}
+        self._task_stats = {}
+        self._totals = {"items": 0, "completed": 0}
+        self._note_fingerprints = {}
+        self.write_stats = {"written": 0, "skipped": 0}
+        self._build_flat_items = build_flat_items
+        self._requested_refresh = False
+        # Serializes snapshot processing so executor results are applied in order.
+        self._process_lock = asyncio.Lock()
+        # Last snapshot confirmed by the server; optimistic updates never land here.
+        self._confirmed = None
+        # Pending optimistic mutations by (kind, id), each (token, action, index_path, fields).
+        self._optimistic = {}
+        self._pending_changes = None
 
     async def _async_update_data(self):
+        if self.client.circuit_open and self.data is not None:
+            _LOGGER.debug("Jotty is unavailable, keeping last known data")
+            return self.data
+
         try:
             summary_task = asyncio.create_task(self.client.get_summary())
             checklists_task = asyncio.create_task(self.client.get_checklists())
@@ -653,41 +1340,538 @@ class JottyDataUpdateCoordinator(DataUpdateCoordinator):
                 return_exceptions=True
             )
             
+            results = (summary, checklists, notes, tasks)
+            if all(isinstance(result, Exception) for result in results):
+                # Outages are ridden out on the last known data. Anything else,
+                # such as a revoked API key or a wrong URL, fails the update so
+                # it shows up; the coordinator keeps the old data either way.
+                error = next((result for result in results if not _is_transient_error(result)), None)
+                if error is None and self.data is not None:
+                    _LOGGER.warning("All Jotty fetches failed, keeping last known data: %s", summary)
+                    return self.data
+                error = error or summary
+                if _is_auth_error(error):
+                    raise UpdateFailed("Jotty rejected the API key, check it in the integration settings") from error
+                raise error
+
+            # Keep serving the last good section instead of blanking it, so a
+            # transient failure does not make every document sensor unavailable.
+            # Take it from the confirmed snapshot so unconfirmed optimistic
+            # changes are neither persisted nor announced as server changes.
+            last = self._confirmed or {}
             if isinstance(summary, Exception):
                 _LOGGER.warning("Summary fetch failed: %s", summary)
-                summary = {"summary": {}}
+                summary = {"summary": last.get("summary", {})}
             if isinstance(checklists, Exception):
-                _LOGGER.warning("Checklists fetch failed: %s", checklists)
-                checklists = {"checklists": []}
+                _LOGGER.warning("Checklists fetch failed, keeping last known checklists: %s", checklists)
+                checklists = {"checklists": last.get("ha_checklists", [])}
             if isinstance(notes, Exception):
-                _LOGGER.warning("Notes fetch failed: %s", notes)
-                notes = {"notes": []}
+                _LOGGER.warning("Notes fetch failed, keeping last known notes: %s", notes)
+                notes = {"notes": last.get("ha_notes", [])}
             if isinstance(tasks, Exception):
-                _LOGGER.warning("Tasks fetch failed: %s", tasks)
-                tasks = {"tasks": []}
+                _LOGGER.warning("Tasks fetch failed, keeping last known tasks: %s", tasks)
+                tasks = {"tasks": last.get("ha_tasks", [])}
             
-            all_checklists = checklists.get("checklists", [])
-            all_notes = notes.get("notes", [])
-            all_tasks = tasks.get("tasks", [])
+            # The client already dropped documents outside the synced categories.
+            ha_checklists = checklists.get("checklists", [])
+            ha_notes = notes.get("notes", [])
+            ha_tasks = tasks.get("tasks", [])
             
-            ha_checklists = [
-                c for c in all_checklists 
-                if c.get("category", "").startswith("Home Assistant")
-            ]
-            ha_notes = [
-                n for n in all_notes 
-                if n.get("category", "").startswith("Home Assistant")
-            ]
-            ha_tasks = [
-                t for t in all_tasks 
-                if t.get("category", "").startswith("Home Assistant")
-            ]
-            
-            return {
-                "summary": summary.get("summary", {}),
-                "ha_checklists": ha_checklists,
-                "ha_notes": ha_notes,
-                "ha_tasks": ha_tasks,
-            }
+            previous = self._confirmed["fingerprints"] if self._confirmed else None
+            data = await self._async_process_data(summary.get("summary", {}), ha_checklists, ha_notes, ha_tasks)
+            changed = data["fingerprints"] != previous
+            # Refreshes that follow our own service calls say nothing about
+            # outside activity, so they leave the polling interval alone.
+            if previous is not None and not self._requested_refresh:
+                self._adapt_interval(changed)
+            if changed:
+                self._schedule_save(data)
+            await self._async_track_changes(data)
+            # A full refresh replaces every optimistic overlay; the refresh
+            # issued when the mutation queue drains settles the rest.
+            self._optimistic.clear()
+            return data
+        except UpdateFailed:
+            raise
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    async def async_restore(self) -> bool:
+        """Load the last persisted snapshot into data. Returns True when one was found."""
+        try:
+            stored = await self._store.async_load()
         except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
\ No newline at end of file
+            _LOGGER.warning("Could not load cached Jotty data: %s", err)
+            return False
+        if not stored:
+            return False
+
+        # Categories may have changed in the options since the snapshot was saved.
+        self.data = await self._async_process_data(
+            stored.get("summary", {}),
+            [d for d in stored.get("checklists", []) if self.category_matcher(d)],
+            [d for d in stored.get("notes", []) if self.category_matcher(d)],
+            [d for d in stored.get("tasks", []) if self.category_matcher(d)],
+        )
+        self._confirmed = self.data
+        return True
+
+    def _schedule_save(self, data):
+        self._store.async_delay_save(
+            lambda: {
+                "summary": data["summary"],
+                "checklists": data["ha_checklists"],
+                "notes": data["ha_notes"],
+                "tasks": data["ha_tasks"],
+            },
+            STORAGE_SAVE_DELAY,
+        )
+
+    def _adapt_interval(self, changed):
+        """Poll fast while documents are changing and back off while idle."""
+        if changed:
+            interval = self._min_interval
+        else:
+            interval = min(self.update_interval * 2, self._max_interval)
+        if interval != self.update_interval:
+            _LOGGER.debug("Polling interval %s -> %s (changed=%s)", self.update_interval, interval, changed)
+            self.update_interval = interval
+
+    async def async_refresh_requested(self):
+        """Run a full refresh on behalf of the refresh scheduler.
+
+        Unlike a scheduled poll it does not feed the adaptive polling interval.
+        """
+        self._requested_refresh = True
+        try:
+            await self.async_refresh()
+        finally:
+            self._requested_refresh = False
+
+    async def async_refresh_document(self, kind, document_id):
+        """Re-fetch a single document and splice it into the current data.
+
+        kind is one of "checklists", "notes" or "tasks". Falls back to a full
+        refresh when the single-document request fails.
+        """
+        fetchers = {
+            "checklists": self.client.get_checklist,
+            "notes": self.client.get_note,
+            "tasks": self.client.get_task,
+        }
+        try:
+            payload = await fetchers[kind](document_id)
+        except Exception as err:
+            _LOGGER.debug("Refreshing %s %s failed, falling back to full refresh: %s", kind, document_id, err)
+            await self.async_refresh_requested()
+            return
+
+        document = payload.get(kind[:-1], payload) if isinstance(payload, dict) else None
+        if not isinstance(document, dict) or document.get("id") != document_id:
+            _LOGGER.debug("Unexpected %s payload for %s, falling back to full refresh", kind, document_id)
+            await self.async_refresh_requested()
+            return
+
+        self._splice_document(kind, document_id, document)
+
+    @callback
+    def async_remove_document(self, kind, document_id):
+        """Drop a deleted document from the current data without a fetch."""
+        self._splice_document(kind, document_id, None)
+
+    @callback
+    def async_apply_optimistic(self, kind, document_id, action, index_path=None, **fields):
+        """Apply an item mutation to the cached document before the server confirms it.
+
+        Listeners are notified straight away. Returns a token the caller hands
+        to async_rollback_optimistic if the server rejects the mutation, or
+        None when nothing was applied.
+        """
+        if self.data is None:
+            return None
+        current = self.data[f"{kind}_by_id"].get(document_id)
+        if current is None:
+            return None
+        try:
+            apply_item_mutation(current, action, index_path, **fields)
+        except (IndexError, ValueError) as err:
+            _LOGGER.debug("Skipping optimistic %s on %s %s: %s", action, kind, document_id, err)
+            return None
+
+        token = object()
+        self._optimistic.setdefault((kind, document_id), []).append((token, action, index_path, fields))
+        self._publish_optimistic()
+        return token
+
+    @callback
+    def async_rollback_optimistic(self, kind, document_id, token):
+        """Undo one optimistic mutation after the server rejected it.
+
+        Other mutations still pending on the same document stay applied.
+        """
+        mutations = self._optimistic.get((kind, document_id))
+        if not mutations:
+            return
+        remaining = [mutation for mutation in mutations if mutation[0] is not token]
+        if len(remaining) == len(mutations):
+            return
+        if remaining:
+            self._optimistic[(kind, document_id)] = remaining
+        else:
+            del self._optimistic[(kind, document_id)]
+        self._publish_optimistic()
+
+    def _publish_optimistic(self):
+        # Push to listeners without touching the polling schedule.
+        self.data = self._build_published(self._confirmed or self.data)
+        self.async_update_listeners()
+
+    def _splice_document(self, kind, document_id, document):
+        """Replace or drop one confirmed document.
+
+        The document is spliced into the confirmed snapshot, which is saved
+        and diffed. Its pending optimistic mutations are dropped and those of
+        other documents are laid over the published data again.
+        """
+        if self.data is None:
+            return
+
+        self._optimistic.pop((kind, document_id), None)
+        base = self._confirmed or self.data
+        lists = self._document_lists(base)
+        lists[kind] = self._replace_document(lists[kind], document_id, document)
+        confirmed = self._process_data(base["summary"], lists["checklists"], lists["notes"], lists["tasks"])
+        self._schedule_save(confirmed)
+        self._track_changes(confirmed)
+        data = self._build_published(confirmed)
+        data["changes"] = confirmed["changes"]
+        self.async_set_updated_data(data)
+
+    def _build_published(self, confirmed):
+        """Return the confirmed snapshot with the pending optimistic mutations replayed."""
+        if not self._optimistic:
+            return confirmed
+        lists = self._document_lists(confirmed)
+        for (kind, document_id), mutations in self._optimistic.items():
+            document = confirmed[f"{kind}_by_id"].get(document_id)
+            if document is None:
+                continue
+            for _token, action, index_path, fields in mutations:
+                try:
+                    document = apply_item_mutation(document, action, index_path, **fields)
+                except (IndexError, ValueError):
+                    continue
+            lists[kind] = self._replace_document(lists[kind], document_id, document)
+        return self._process_data(confirmed["summary"], lists["checklists"], lists["notes"], lists["tasks"])
+
+    @staticmethod
+    def _document_lists(data):
+        return {key: data[f"ha_{key}"] for key in ("checklists", "notes", "tasks")}
+
+    def _replace_document(self, documents, document_id, document):
+        """Return documents with document_id replaced by document, or dropped when it is None."""
+        keep = document is not None and self.category_matcher(document)
+        result = []
+        replaced = False
+        for existing in documents:
+            if existing["id"] == document_id:
+                replaced = True
+                if keep:
+                    result.append(document)
+            else:
+                result.append(existing)
+        if keep and not replaced:
+            result.append(document)
+        return result
+
+    def _track_changes(self, data):
+        """Diff a confirmed snapshot against the previous one.
+
+        The change set is stored under "changes" and announced once listeners
+        have seen the new data.
+        """
+        previous, self._confirmed = self._confirmed, data
+        if previous is None or previous["fingerprints"] == data["fingerprints"]:
+            return
+        data["changes"] = self._diff_snapshots(previous, data, self._build_flat_items)
+        self._pending_changes = data["changes"]
+
+    async def _async_track_changes(self, data):
+        """_track_changes for full refreshes, diffing in the executor for big changes."""
+        previous = self._confirmed
+        if (
+            previous is None
+            or previous["fingerprints"] == data["fingerprints"]
+            or self._diff_size(previous, data) < EXECUTOR_ITEM_THRESHOLD
+        ):
+            self._track_changes(data)
+            return
+
+        self._confirmed = data
+        data["changes"] = await self.hass.async_add_executor_job(
+            self._diff_snapshots, previous, data, self._build_flat_items
+        )
+        self._pending_changes = data["changes"]
+
+    @staticmethod
+    def _diff_size(previous, current):
+        """Count the items of both versions of every list whose fingerprint changed."""
+        size = 0
+        for kind, stats_key in (("checklists", "checklist_stats"), ("tasks", "task_stats")):
+            before = previous["fingerprints"][kind]
+            for document_id, fingerprint in current["fingerprints"][kind].items():
+                old_fingerprint = before.get(document_id)
+                if old_fingerprint is None or old_fingerprint == fingerprint:
+                    continue
+                size += previous[stats_key][document_id]["total"] + current[stats_key][document_id]["total"]
+        return size
+
+    @callback
+    def async_update_listeners(self) -> None:
+        super().async_update_listeners()
+        changes, self._pending_changes = self._pending_changes, None
+        if changes:
+            self._fire_change_events(changes)
+
+    def _fire_change_events(self, changes):
+        """Fire jotty_document_changed plus typed events batched per document.
+
+        Typed events carry every matching item of one document, and at most
+        MAX_EVENTS_PER_REFRESH of them are fired per refresh.
+        """
+        typed_events = []
+        for kind, documents in changes.items():
+            for document_id, change in documents.items():
+                base = {"kind": kind[:-1], "document_id": document_id, "title": change["title"]}
+                self.hass.bus.async_fire(EVENT_DOCUMENT_CHANGED, {**base, **change})
+                if change["change"] == "removed":
+                    typed_events.append((EVENT_DOCUMENT_REMOVED, base))
+                    continue
+                for event_type, items in self._typed_item_changes(kind, change["items"]):
+                    typed_events.append((event_type, {**base, "items": items}))
+
+        for event_type, event_data in typed_events[:MAX_EVENTS_PER_REFRESH]:
+            self.hass.bus.async_fire(event_type, event_data)
+        if len(typed_events) > MAX_EVENTS_PER_REFRESH:
+            _LOGGER.debug(
+                "Dropped %s Jotty item events over the per-refresh limit of %s",
+                len(typed_events) - MAX_EVENTS_PER_REFRESH,
+                MAX_EVENTS_PER_REFRESH,
+            )
+
+    @staticmethod
+    def _typed_item_changes(kind, items):
+        added = [item for item in items if item["type"] == "added"]
+        completed = [
+            item for item in items
+            if item["type"] == "status_changed" and item["status"] == "completed"
+        ]
+        moved = [] if kind != "tasks" else [
+            item for item in items if item["type"] in ("moved", "status_changed")
+        ]
+        for event_type, batch in (
+            (EVENT_ITEM_ADDED, added),
+            (EVENT_ITEM_COMPLETED, completed),
+            (EVENT_TASK_ITEM_MOVED, moved),
+        ):
+            if batch:
+                yield event_type, batch
+
+    @staticmethod
+    def _diff_snapshots(previous, current, build_flat_items=True):
+        """Return {kind: {document_id: change}} for every document that differs.
+
+        Only documents whose fingerprint changed are compared item by item.
+        Without build_flat_items the flat lists are built just for the diff
+        and not cached on the stats.
+        """
+        if build_flat_items:
+            flat = get_flat_items
+        else:
+            def flat(stats):
+                return flatten_items(stats["items"])
+        changes = {}
+        for kind in ("checklists", "notes", "tasks"):
+            before = previous["fingerprints"][kind]
+            after = current["fingerprints"][kind]
+            stats_key = {"checklists": "checklist_stats", "tasks": "task_stats"}.get(kind)
+            documents = {}
+            for document_id, fingerprint in after.items():
+                old_fingerprint = before.get(document_id)
+                if old_fingerprint == fingerprint:
+                    continue
+                document = current[f"{kind}_by_id"][document_id]
+                items = []
+                if old_fingerprint is not None and stats_key is not None:
+                    items = diff_items(
+                        flat(previous[stats_key][document_id]),
+                        flat(current[stats_key][document_id]),
+                    )
+                documents[document_id] = {
+                    "change": "added" if old_fingerprint is None else "updated",
+                    "title": document.get("title", ""),
+                    "items": items,
+                }
+            for document_id in before.keys() - after.keys():
+                document = previous[f"{kind}_by_id"][document_id]
+                documents[document_id] = {
+                    "change": "removed",
+                    "title": document.get("title", ""),
+                    "items": [],
+                }
+            if documents:
+                changes[kind] = documents
+        return changes
+
+    async def _async_process_data(self, summary, ha_checklists, ha_notes, ha_tasks):
+        """Build a snapshot, computing fingerprints and stats in the executor for big boards.
+
+        Small payloads are processed inline since a thread hop costs more than
+        the work itself.
+        """
+        async with self._process_lock:
+            previous = self.data or {}
+            size = sum(
+                self._estimate_size(documents, cached)
+                for documents, key, cached in (
+                    (ha_checklists, "ha_checklists", self._checklist_stats),
+                    (ha_notes, "ha_notes", {}),
+                    (ha_tasks, "ha_tasks", self._task_stats),
+                )
+                if documents is not previous.get(key)
+            )
+            if size < EXECUTOR_ITEM_THRESHOLD:
+                return self._process_data(summary, ha_checklists, ha_notes, ha_tasks)
+
+            _LOGGER.debug("Processing %s documents and items in the executor", size)
+            computed = await self.hass.async_add_executor_job(
+                self._compute_stats,
+                None if ha_checklists is previous.get("ha_checklists") else ha_checklists,
+                None if ha_notes is previous.get("ha_notes") else ha_notes,
+                None if ha_tasks is previous.get("ha_tasks") else ha_tasks,
+                self._checklist_stats,
+                self._task_stats,
+                self._build_flat_items,
+            )
+            return self._process_data(summary, ha_checklists, ha_notes, ha_tasks, computed)
+
+    @staticmethod
+    def _estimate_size(documents, cached):
+        """Count documents plus their items, nested ones included.
+
+        Item counts come from the cached stats of each document's previous
+        version; documents seen for the first time count their top-level items.
+        """
+        size = 0
+        for document in documents:
+            entry = cached.get(document["id"])
+            size += 1 + (entry[1]["total"] if entry is not None else len(document.get("items") or ()))
+        return size
+
+    @classmethod
+    def _compute_stats(cls, ha_checklists, ha_notes, ha_tasks, checklist_stats, task_stats, build_flat_items):
+        """Executor side of _async_process_data. Lists passed as None are unchanged."""
+        checklists = None if ha_checklists is None else cls._refresh_stats(ha_checklists, checklist_stats)
+        tasks = None if ha_tasks is None else cls._refresh_stats(ha_tasks, task_stats)
+        notes = None if ha_notes is None else {n["id"]: document_fingerprint(n) for n in ha_notes}
+        if build_flat_items:
+            for current, cached in ((checklists, checklist_stats), (tasks, task_stats)):
+                for doc_id, entry in (current or {}).items():
+                    if cached.get(doc_id) is not entry:
+                        get_flat_items(entry[1])
+        return {"checklists": checklists, "notes": notes, "tasks": tasks}
+
+    def _process_data(self, summary, ha_checklists, ha_notes, ha_tasks, computed=None):
+        """Build the coordinator snapshot from the filtered documents.
+
+        computed holds results from _compute_stats; lists it leaves as None
+        are refreshed inline.
+        """
+        previous = self.data or {}
+        computed = computed or {}
+        if computed.get("checklists") is not None:
+            checklist_stats = computed["checklists"]
+        elif ha_checklists is not previous.get("ha_checklists"):
+            checklist_stats = self._refresh_stats(ha_checklists, self._checklist_stats)
+        else:
+            checklist_stats = self._checklist_stats
+        self._adjust_totals(self._totals, self._checklist_stats, checklist_stats)
+        self._checklist_stats = checklist_stats
+        if computed.get("tasks") is not None:
+            self._task_stats = computed["tasks"]
+        elif ha_tasks is not previous.get("ha_tasks"):
+            self._task_stats = self._refresh_stats(ha_tasks, self._task_stats)
+        if computed.get("notes") is not None:
+            self._note_fingerprints = computed["notes"]
+        elif ha_notes is not previous.get("ha_notes"):
+            self._note_fingerprints = {n["id"]: document_fingerprint(n) for n in ha_notes}
+
+        total = self._totals["items"]
+        completed = self._totals["completed"]
+
+        return {
+            "summary": summary,
+            "ha_checklists": ha_checklists,
+            "ha_notes": ha_notes,
+            "ha_tasks": ha_tasks,
+            "checklists_by_id": {c["id"]: c for c in ha_checklists},
+            "notes_by_id": {n["id"]: n for n in ha_notes},
+            "tasks_by_id": {t["id"]: t for t in ha_tasks},
+            "checklist_stats": {doc_id: entry[1] for doc_id, entry in self._checklist_stats.items()},
+            "task_stats": {doc_id: entry[1] for doc_id, entry in self._task_stats.items()},
+            "changes": {},
+            "fingerprints": {
+                "notes": self._note_fingerprints,
+                "checklists": {doc_id: entry[0] for doc_id, entry in self._checklist_stats.items()},
+                "tasks": {doc_id: entry[0] for doc_id, entry in self._task_stats.items()},
+            },
+            "totals": {
+                "total_notes": len(ha_notes),
+                "total_checklists": len(ha_checklists),
+                "total_tasks": len(ha_tasks),
+                "total_items": total,
+                "completed_items": completed,
+                "pending_items": total - completed,
+                "completion_rate": round((completed / total * 100) if total > 0 else 0, 1),
+            },
+        }
+
+    @staticmethod
+    def _refresh_stats(documents, previous):
+        """Recompute stats only for documents whose fingerprint changed.
+
+        Unchanged documents keep their cached entry object. previous is only
+        read, so this is safe to run in the executor.
+        """
+        current = {}
+        for document in documents:
+            doc_id = document["id"]
+            fingerprint = document_fingerprint(document)
+            cached = previous.get(doc_id)
+            if cached is not None and cached[0] == fingerprint:
+                current[doc_id] = cached
+                continue
+            current[doc_id] = (fingerprint, compute_item_stats(document.get("items", [])))
+        return current
+
+    @staticmethod
+    def _adjust_totals(totals, previous, current):
+        """Adjust totals by the delta of every added, changed or removed document.
+
+        Entries reused from previous are recognised by identity, so unchanged
+        documents cost nothing and totals are never summed from scratch.
+        """
+        if current is previous:
+            return
+        for doc_id, entry in current.items():
+            cached = previous.get(doc_id)
+            if cached is entry:
+                continue
+            if cached is not None:
+                totals["items"] -= cached[1]["total"]
+                totals["completed"] -= cached[1]["completed"]
+            totals["items"] += entry[1]["total"]
+            totals["completed"] += entry[1]["completed"]
+        for doc_id in previous.keys() - current.keys():
+            totals["items"] -= previous[doc_id][1]["total"]
+            totals["completed"] -= previous[doc_id][1]["completed"]
@@ -7,11 +7,29 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_API_KEY, CONF_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import (
+    ATTRIBUTE_MODES,
+    CONF_ATTRIBUTE_MODE,
+    CONF_CATEGORY_EXCLUDE,
+    CONF_CATEGORY_NAMES,
+    CONF_CATEGORY_PREFIXES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PUSH_ENABLED,
+    CONF_SERVER_FILTER,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PUSH_ENABLED,
+    DEFAULT_SERVER_FILTER,
+    DOMAIN,
+    HA_CATEGORY,
+)
+from .helpers import split_categories
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,4 +91,86 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            options = {
+                **user_input,
+                CONF_CATEGORY_PREFIXES: split_categories(user_input.get(CONF_CATEGORY_PREFIXES)),
+                CONF_CATEGORY_NAMES: split_categories(user_input.get(CONF_CATEGORY_NAMES)),
+                CONF_CATEGORY_EXCLUDE: split_categories(user_input.get(CONF_CATEGORY_EXCLUDE)),
+            }
+            if options[CONF_MIN_SCAN_INTERVAL] > options[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_interval"
+            elif not options[CONF_CATEGORY_PREFIXES] and not options[CONF_CATEGORY_NAMES]:
+                errors["base"] = "no_categories"
+            else:
+                return self.async_create_entry(title="", data=options)
+
+        options = self._entry.options
+        # Suggested values rather than defaults, so a field the user clears
+        # stays empty instead of being filled back in with the old value.
+        categories = {
+            key: ", ".join(options.get(key, fallback))
+            for key, fallback in (
+                (CONF_CATEGORY_PREFIXES, [HA_CATEGORY]),
+                (CONF_CATEGORY_NAMES, []),
+                (CONF_CATEGORY_EXCLUDE, []),
+            )
+        }
+        if user_input is not None:
+            categories.update({key: user_input.get(key, "") for key in categories})
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_CATEGORY_PREFIXES,
+                    description={"suggested_value": categories[CONF_CATEGORY_PREFIXES]},
+                ): str,
+                vol.Optional(
+                    CONF_CATEGORY_NAMES,
+                    description={"suggested_value": categories[CONF_CATEGORY_NAMES]},
+                ): str,
+                vol.Optional(
+                    CONF_CATEGORY_EXCLUDE,
+                    description={"suggested_value": categories[CONF_CATEGORY_EXCLUDE]},
+                ): str,
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                vol.Required(
+                    CONF_PUSH_ENABLED,
+                    default=options.get(CONF_PUSH_ENABLED, DEFAULT_PUSH_ENABLED),
+                ): bool,
+                vol.Required(
+                    CONF_SERVER_FILTER,
+                    default=options.get(CONF_SERVER_FILTER, DEFAULT_SERVER_FILTER),
+                ): bool,
+                vol.Required(
+                    CONF_ATTRIBUTE_MODE,
+                    default=options.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE),
+                ): vol.In(ATTRIBUTE_MODES),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -1 +1,36 @@
 DOMAIN = "jotty"
+
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+
+DEFAULT_MIN_SCAN_INTERVAL = 30
+DEFAULT_MAX_SCAN_INTERVAL = 1800
+
+CONF_PUSH_ENABLED = "push_enabled"
+
+DEFAULT_PUSH_ENABLED = False
+
+CONF_SERVER_FILTER = "server_side_filter"
+
+DEFAULT_SERVER_FILTER = False
+
+HA_CATEGORY = "Home Assistant"
+
+CONF_CATEGORY_PREFIXES = "category_prefixes"
+CONF_CATEGORY_NAMES = "category_names"
+CONF_CATEGORY_EXCLUDE = "category_exclude"
+
+CONF_ATTRIBUTE_MODE = "attribute_mode"
+
+ATTRIBUTE_MODE_FULL = "full"
+ATTRIBUTE_MODE_FLAT = "flat"
+ATTRIBUTE_MODE_SUMMARY = "summary"
+ATTRIBUTE_MODES = [ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODE_FLAT, ATTRIBUTE_MODE_SUMMARY]
+
+DEFAULT_ATTRIBUTE_MODE = ATTRIBUTE_MODE_FULL
+
+EVENT_DOCUMENT_CHANGED = f"{DOMAIN}_document_changed"
+EVENT_DOCUMENT_REMOVED = f"{DOMAIN}_document_removed"
+EVENT_ITEM_ADDED = f"{DOMAIN}_item_added"
+EVENT_ITEM_COMPLETED = f"{DOMAIN}_item_completed"
+EVENT_TASK_ITEM_MOVED = f"{DOMAIN}_task_item_moved"
@@ -0,0 +1,24 @@
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "documents": {
+            "notes": len(data.get("ha_notes", [])),
+            "checklists": len(data.get("ha_checklists", [])),
+            "tasks": len(data.get("ha_tasks", [])),
+        },
+        "state_writes": dict(coordinator.write_stats),
+        "circuit_open": coordinator.client.circuit_open,
+    }
@@ -0,0 +1,280 @@
+"""Item tree helpers shared by the coordinator and the sensor platform."""
+import hashlib
+import json
+import re
+
+from .const import HA_CATEGORY
+
+
+def flatten_items(items, prefix=""):
+    """Flatten nested items into a list with index paths.
+
+    Entries are slim copies without the ``children`` subtree, so the flat
+    list stays linear in the number of items however deep the tree is.
+    """
+    result = []
+    _flatten_into(items, prefix, result)
+    return result
+
+def _flatten_into(items, prefix, result):
+    for i, item in enumerate(items):
+        index_path = f"{prefix}{i}" if prefix == "" else f"{prefix}.{i}"
+        flat_item = {key: value for key, value in item.items() if key != "children"}
+        flat_item["index_path"] = index_path
+        result.append(flat_item)
+        if item.get("children"):
+            _flatten_into(item["children"], index_path, result)
+
+def compute_item_stats(items):
+    """Walk an item tree once and collect everything the sensors need.
+
+    Returns a dict with the total item count, the completed count (an item is
+    completed when flagged or in the "completed" status) and the number of
+    items per status. The flattened item list is built on first use by
+    get_flat_items and kept on the same dict.
+    """
+    stats = {"total": 0, "completed": 0, "status_counts": {}, "items": items, "flat_items": None}
+    _walk_items(items, stats)
+    return stats
+
+def _walk_items(items, stats):
+    status_counts = stats["status_counts"]
+    for item in items:
+        stats["total"] += 1
+        status = item.get("status")
+        if item.get("completed", False) or status == "completed":
+            stats["completed"] += 1
+        if status is not None:
+            status_counts[status] = status_counts.get(status, 0) + 1
+        if item.get("children"):
+            _walk_items(item["children"], stats)
+
+def get_flat_items(stats):
+    """Return the flat item index for a stats dict, building it once.
+
+    Stats are cached per document fingerprint, so the index is shared by
+    every attribute read until the document changes.
+    """
+    if stats["flat_items"] is None:
+        stats["flat_items"] = flatten_items(stats["items"])
+    return stats["flat_items"]
+
+def window_items(flat_items, offset=0, limit=None, status=None, search=None):
+    """Return (matched, window) for a slice of a flat item index.
+
+    status matches an item's status, with "completed" and "pending" also
+    honouring the checklist completed flag. search is a case-insensitive
+    substring match on the item text. matched is the count before slicing.
+    """
+    if status is not None or search:
+        needle = search.casefold() if search else None
+        flat_items = [
+            item for item in flat_items
+            if _status_matches(item, status)
+            and (needle is None or needle in str(item.get("text", "")).casefold())
+        ]
+    end = None if limit is None else offset + limit
+    return len(flat_items), flat_items[offset:end]
+
+def _status_matches(item, status):
+    if status is None:
+        return True
+    completed = item.get("completed", False) or item.get("status") == "completed"
+    if status == "completed":
+        return completed
+    if status == "pending":
+        return not completed
+    return item.get("status") == status
+
+def item_status(item):
+    """Return an item's status, deriving one from the completed flag for checklists."""
+    status = item.get("status")
+    if status is not None:
+        return status
+    return "completed" if item.get("completed", False) else "pending"
+
+def diff_items(previous_items, current_items):
+    """Compare two flat item lists and describe what happened to each item.
+
+    Items are matched by id when they have one and by index path otherwise,
+    so moves can only be detected for items with ids, and only at the top
+    level or under a parent that has an id. An item counts as moved when its
+    parent or its order among the surviving siblings changed, not merely
+    because an earlier sibling was added or removed. Each change is a
+    dict with a "type" of added, removed, moved or status_changed.
+    """
+    before = {_item_key(item): item for item in previous_items}
+    after = {_item_key(item): item for item in current_items}
+    common = before.keys() & after.keys()
+    before_positions = _item_positions(previous_items, common)
+    after_positions = _item_positions(current_items, common)
+    changes = []
+    for key, item in after.items():
+        old = before.get(key)
+        if old is None:
+            changes.append(_item_change("added", item))
+            continue
+        position = before_positions[key]
+        if None not in (position, after_positions[key]) and position != after_positions[key]:
+            changes.append(_item_change("moved", item, old))
+        if item_status(old) != item_status(item):
+            changes.append(_item_change("status_changed", item, old))
+    for key, item in before.items():
+        if key not in after:
+            changes.append(_item_change("removed", item))
+    return changes
+
+def _item_key(item):
+    item_id = item.get("id")
+    return item_id if item_id else f"@{item['index_path']}"
+
+def _item_positions(flat_items, keys):
+    """Map each key to (parent id, rank among siblings that are in keys).
+
+    Children of a parent without an id map to None: such a parent is only
+    known by its index path, which shifts whenever an earlier item is added
+    or removed.
+    """
+    by_path = {item["index_path"]: item for item in flat_items}
+    ranks = {}
+    positions = {}
+    for item in flat_items:
+        key = _item_key(item)
+        if key not in keys:
+            continue
+        parent_path = item["index_path"].rpartition(".")[0]
+        parent = by_path[parent_path].get("id") if parent_path else None
+        if parent_path and not parent:
+            positions[key] = None
+            continue
+        rank = ranks.get(parent, 0)
+        ranks[parent] = rank + 1
+        positions[key] = (parent, rank)
+    return positions
+
+def _item_change(change_type, item, previous=None):
+    change = {
+        "type": change_type,
+        "id": item.get("id"),
+        "index_path": item["index_path"],
+        "text": item.get("text", ""),
+        "status": item_status(item),
+    }
+    if previous is not None:
+        change["previous_index_path"] = previous["index_path"]
+        change["previous_status"] = item_status(previous)
+    return change
+
+def document_fingerprint(document):
+    """Return a stable fingerprint that changes whenever the document does."""
+    payload = json.dumps(document, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+    return f"{document.get('updatedAt', '')}:{digest}"
+
+def parse_index_path(index_path):
+    """Turn an index path such as "0.2.1" into a list of ints."""
+    return [int(part) for part in str(index_path).strip().split(".")]
+
+def get_item(document, index_path):
+    """Return the item at index_path, or None when it does not exist."""
+    try:
+        path = parse_index_path(index_path)
+    except ValueError:
+        return None
+    items = document.get("items", [])
+    item = None
+    for index in path:
+        if index < 0 or index >= len(items):
+            return None
+        item = items[index]
+        items = item.get("children") or []
+    return item
+
+def apply_item_mutation(document, action, index_path=None, **fields):
+    """Return a copy of document with a single item mutation applied.
+
+    Only the document, the item lists and the items along index_path are
+    copied; every other subtree is shared with the original. Supported
+    actions are "check", "uncheck", "set_status", "add" (index_path is the
+    optional parent) and "delete". Raises IndexError or ValueError when the
+    path does not exist.
+    """
+    if action == "add":
+        parents = parse_index_path(index_path) if index_path not in (None, "") else []
+        updated, siblings = _copy_item_path(document, parents)
+        item = {"text": fields["text"], "completed": False, "children": []}
+        if fields.get("status"):
+            item["status"] = fields["status"]
+        siblings.append(item)
+        return updated
+
+    path = parse_index_path(index_path)
+    updated, siblings = _copy_item_path(document, path[:-1])
+    index = path[-1]
+    if index < 0 or index >= len(siblings):
+        raise IndexError(f"No item at index path {index_path}")
+
+    if action == "delete":
+        del siblings[index]
+    elif action == "check":
+        siblings[index] = {**siblings[index], "completed": True}
+    elif action == "uncheck":
+        siblings[index] = {**siblings[index], "completed": False}
+    elif action == "set_status":
+        siblings[index] = {**siblings[index], "status": fields["status"]}
+    else:
+        raise ValueError(f"Unknown item action {action}")
+    return updated
+
+def _copy_item_path(document, parents):
+    """Copy the document down to the children list addressed by parents."""
+    updated = dict(document)
+    items = list(document.get("items", []))
+    updated["items"] = items
+    for index in parents:
+        if index < 0 or index >= len(items):
+            raise IndexError(f"No item at index {index}")
+        item = dict(items[index])
+        items[index] = item
+        items = list(item.get("children") or [])
+        item["children"] = items
+    return updated, items
+
+def split_categories(value):
+    """Split a comma separated category list, dropping empty entries."""
+    if isinstance(value, (list, tuple)):
+        return [str(part).strip() for part in value if str(part).strip()]
+    return [part.strip() for part in str(value or "").split(",") if part.strip()]
+
+class CategoryMatcher:
+    """Precompiled category filter shared by notes, checklists and tasks.
+
+    A document is synced when its category starts with one of the prefixes or
+    equals one of the exact names, and does not start with an excluded prefix.
+    """
+
+    def __init__(self, prefixes=(HA_CATEGORY,), names=(), exclude=()):
+        self.prefixes = list(prefixes)
+        self.names = list(names)
+        include = [re.escape(prefix) for prefix in self.prefixes]
+        include += [re.escape(name) + r"\Z" for name in self.names]
+        self._include = re.compile("|".join(include)) if include else None
+        self._exclude = re.compile("|".join(re.escape(prefix) for prefix in exclude)) if exclude else None
+
+    def __call__(self, document):
+        return self.matches(document.get("category", ""))
+
+    def matches(self, category):
+        if self._include is None or not self._include.match(category or ""):
+            return False
+        return self._exclude is None or not self._exclude.match(category)
+
+    @property
+    def default_category(self):
+        """Category used for documents created from Home Assistant."""
+        categories = self.prefixes + self.names
+        return categories[0] if categories else HA_CATEGORY
+
+    @property
+    def server_categories(self):
+        return self.prefixes + self.names
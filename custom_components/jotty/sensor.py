@@ -1,50 +1,30 @@
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import re
 import logging
 
-from .const import DOMAIN
+from .const import (
+    ATTRIBUTE_MODE_FULL,
+    ATTRIBUTE_MODE_SUMMARY,
+    CONF_ATTRIBUTE_MODE,
+    DEFAULT_ATTRIBUTE_MODE,
+    DOMAIN,
+)
+from .helpers import get_flat_items
 
 _LOGGER = logging.getLogger(__name__)
 
+DOCUMENT_UNIQUE_ID_PREFIXES = ("jotty_note_", "jotty_list_", "jotty_task_")
+
 def slugify(text):
     text = text.lower()
     text = re.sub(r'[^a-z0-9]+', '_', text)
     return text.strip('_')
 
-def flatten_items(items, prefix=""):
-    """Flatten nested items into a list with index paths."""
-    result = []
-    for i, item in enumerate(items):
-        index_path = f"{prefix}{i}" if prefix == "" else f"{prefix}.{i}"
-        flat_item = {**item, "index_path": index_path}
-        result.append(flat_item)
-        if item.get("children"):
-            result.extend(flatten_items(item["children"], index_path))
-    return result
-
-def count_items_recursive(items):
-    """Count all items including nested children."""
-    count = 0
-    for item in items:
-        count += 1
-        if item.get("children"):
-            count += count_items_recursive(item["children"])
-    return count
-
-def count_completed_recursive(items):
-    """Count completed items including nested children."""
-    count = 0
-    for item in items:
-        if item.get("completed", False) or item.get("status") == "completed":
-            count += 1
-        if item.get("children"):
-            count += count_completed_recursive(item["children"])
-    return count
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -64,11 +44,11 @@ async def async_setup_entry(
     
     async_add_entities(sensors)
     
-    if "ha_entity_ids" not in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["ha_entity_ids"] = set()
+    if "ha_entities" not in hass.data[DOMAIN][entry.entry_id]:
+        hass.data[DOMAIN][entry.entry_id]["ha_entities"] = {}
 
-    await coordinator.async_config_entry_first_refresh()
     await _update_ha_entities(hass, entry, coordinator, async_add_entities)
+    _remove_orphaned_entities(hass, entry)
     
     def handle_update():
         hass.async_create_task(_update_ha_entities(hass, entry, coordinator, async_add_entities))
@@ -76,6 +56,7 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(handle_update))
 
 async def _update_ha_entities(hass, entry, coordinator, async_add_entities):
+    attribute_mode = entry.options.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE)
     ha_notes = coordinator.data.get("ha_notes", [])
     ha_lists = coordinator.data.get("ha_checklists", [])
     ha_tasks = coordinator.data.get("ha_tasks", [])
@@ -86,33 +67,63 @@ async def _update_ha_entities(hass, entry, coordinator, async_add_entities):
     current_ids.update({f"list_{l['id']}" for l in ha_lists})
     current_ids.update({f"task_{t['id']}" for t in ha_tasks})
     
-    tracked_ids = hass.data[DOMAIN][entry.entry_id]["ha_entity_ids"]
+    tracked = hass.data[DOMAIN][entry.entry_id]["ha_entities"]
+    
+    for key in tracked.keys() - current_ids:
+        await _remove_entity(hass, tracked.pop(key))
     
-    new_ids = current_ids - tracked_ids
+    new_ids = current_ids - tracked.keys()
     if new_ids:
         new_entities = []
         
         for note in ha_notes:
             note_id = f"note_{note['id']}"
             if note_id in new_ids:
-                new_entities.append(JottyNoteSensor(coordinator, note['id'], note['title']))
+                tracked[note_id] = JottyNoteSensor(coordinator, note['id'], note['title'])
+                new_entities.append(tracked[note_id])
                 _LOGGER.debug(f"Adding note sensor: {note['title']}")
         
         for checklist in ha_lists:
             list_id = f"list_{checklist['id']}"
             if list_id in new_ids:
-                new_entities.append(JottyChecklistSensor(coordinator, checklist['id'], checklist['title']))
+                tracked[list_id] = JottyChecklistSensor(coordinator, checklist['id'], checklist['title'], attribute_mode)
+                new_entities.append(tracked[list_id])
                 _LOGGER.debug(f"Adding checklist sensor: {checklist['title']}")
         
         for task in ha_tasks:
             task_id = f"task_{task['id']}"
             if task_id in new_ids:
-                new_entities.append(JottyTaskSensor(coordinator, task['id'], task['title']))
+                tracked[task_id] = JottyTaskSensor(coordinator, task['id'], task['title'], attribute_mode)
+                new_entities.append(tracked[task_id])
                 _LOGGER.debug(f"Adding task sensor: {task['title']}")
         
         if new_entities:
             async_add_entities(new_entities)
-            tracked_ids.update(new_ids)
+
+async def _remove_entity(hass, entity):
+    """Remove a document sensor from the platform and the entity registry."""
+    _LOGGER.debug("Removing sensor for vanished document: %s", entity.unique_id)
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, entity.unique_id)
+    if entity_id is not None:
+        # Removing the registry entry also removes the entity from the platform.
+        registry.async_remove(entity_id)
+    elif entity.hass is not None:
+        await entity.async_remove(force_remove=True)
+
+def _remove_orphaned_entities(hass, entry):
+    """Drop registry entries left behind by documents deleted while HA was stopped."""
+    current_unique_ids = {
+        entity.unique_id for entity in hass.data[DOMAIN][entry.entry_id]["ha_entities"].values()
+    }
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        unique_id = registry_entry.unique_id
+        if not unique_id.startswith(DOCUMENT_UNIQUE_ID_PREFIXES):
+            continue
+        if unique_id not in current_unique_ids:
+            _LOGGER.debug("Removing orphaned Jotty entity: %s", registry_entry.entity_id)
+            registry.async_remove(registry_entry.entity_id)
 
 class JottySensor(CoordinatorEntity, SensorEntity):
 
@@ -125,43 +136,7 @@ class JottySensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        ha_notes = self.coordinator.data.get("ha_notes", [])
-        ha_lists = self.coordinator.data.get("ha_checklists", [])
-        
-        if self._sensor_type == "total_notes":
-            return len(ha_notes)
-        elif self._sensor_type == "total_checklists":
-            return len(ha_lists)
-        elif self._sensor_type == "total_items":
-            total = 0
-            for checklist in ha_lists:
-                total += count_items_recursive(checklist.get("items", []))
-            return total
-        elif self._sensor_type == "completed_items":
-            completed = 0
-            for checklist in ha_lists:
-                completed += count_completed_recursive(checklist.get("items", []))
-            return completed
-        elif self._sensor_type == "pending_items":
-            total = 0
-            completed = 0
-            for checklist in ha_lists:
-                items = checklist.get("items", [])
-                total += count_items_recursive(items)
-                completed += count_completed_recursive(items)
-            return total - completed
-        elif self._sensor_type == "completion_rate":
-            total = 0
-            completed = 0
-            for checklist in ha_lists:
-                items = checklist.get("items", [])
-                total += count_items_recursive(items)
-                completed += count_completed_recursive(items)
-            return round((completed / total * 100) if total > 0 else 0, 1)
-        elif self._sensor_type == "total_tasks":
-            return len(self.coordinator.data.get("ha_tasks", []))
-        
-        return 0
+        return self.coordinator.data.get("totals", {}).get(self._sensor_type, 0)
 
     @property
     def extra_state_attributes(self):
@@ -174,10 +149,51 @@ class JottySensor(CoordinatorEntity, SensorEntity):
         
         return {}
 
-class JottyNoteSensor(CoordinatorEntity, SensorEntity):
+class JottyDocumentSensor(CoordinatorEntity, SensorEntity):
+    """Base for sensors that mirror a single Jotty document."""
 
-    def __init__(self, coordinator, note_id, title):
+    _document_kind = None
+
+    def __init__(self, coordinator, document_id, attribute_mode=ATTRIBUTE_MODE_FULL):
         super().__init__(coordinator)
+        self._document_id = document_id
+        self._attribute_mode = attribute_mode
+        self._last_fingerprint = self._get_fingerprint()
+
+    def _apply_attribute_mode(self, attributes):
+        """Drop the item attributes the configured attribute mode leaves out."""
+        if self._attribute_mode != ATTRIBUTE_MODE_FULL:
+            attributes.pop("items", None)
+        if self._attribute_mode == ATTRIBUTE_MODE_SUMMARY:
+            attributes.pop("flat_items", None)
+        return attributes
+
+    def _get_flat_items(self, stats):
+        """Return the shared flat index, skipping the build in summary mode."""
+        if self._attribute_mode == ATTRIBUTE_MODE_SUMMARY:
+            return []
+        return get_flat_items(stats)
+
+    def _get_fingerprint(self):
+        fingerprints = self.coordinator.data.get("fingerprints", {})
+        return fingerprints.get(self._document_kind, {}).get(self._document_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        fingerprint = self._get_fingerprint()
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            self.coordinator.write_stats["skipped"] += 1
+            return
+        self._last_fingerprint = fingerprint
+        self.coordinator.write_stats["written"] += 1
+        super()._handle_coordinator_update()
+
+class JottyNoteSensor(JottyDocumentSensor):
+
+    _document_kind = "notes"
+
+    def __init__(self, coordinator, note_id, title):
+        super().__init__(coordinator, note_id)
         self.note_id = note_id
         self._title = title
         self._attr_name = f"Jotty Note: {title}"
@@ -205,7 +221,7 @@ class JottyNoteSensor(CoordinatorEntity, SensorEntity):
         return {
             "note_id": self.note_id,
             "content": "",
-            "category": "Home Assistant",
+            "category": self.coordinator.category_matcher.default_category,
         }
 
     @property
@@ -213,16 +229,15 @@ class JottyNoteSensor(CoordinatorEntity, SensorEntity):
         return self._get_note() is not None
 
     def _get_note(self):
-        ha_notes = self.coordinator.data.get("ha_notes", [])
-        for note in ha_notes:
-            if note["id"] == self.note_id:
-                return note
-        return None
+        return self.coordinator.data.get("notes_by_id", {}).get(self.note_id)
 
-class JottyChecklistSensor(CoordinatorEntity, SensorEntity):
+class JottyChecklistSensor(JottyDocumentSensor):
 
-    def __init__(self, coordinator, checklist_id, title):
-        super().__init__(coordinator)
+    _document_kind = "checklists"
+    _unrecorded_attributes = frozenset({"items", "flat_items"})
+
+    def __init__(self, coordinator, checklist_id, title, attribute_mode=ATTRIBUTE_MODE_FULL):
+        super().__init__(coordinator, checklist_id, attribute_mode)
         self.checklist_id = checklist_id
         self._title = title
         self._attr_name = f"Jotty List: {title}"
@@ -231,12 +246,9 @@ class JottyChecklistSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        checklist = self._get_checklist()
-        if checklist:
-            items = checklist.get("items", [])
-            completed = count_completed_recursive(items)
-            total = count_items_recursive(items)
-            return f"{completed}/{total}"
+        stats = self._get_stats()
+        if stats:
+            return f"{stats['completed']}/{stats['total']}"
         return "0/0"
 
     @property
@@ -244,11 +256,12 @@ class JottyChecklistSensor(CoordinatorEntity, SensorEntity):
         checklist = self._get_checklist()
         if checklist:
             items = checklist.get("items", [])
-            completed = count_completed_recursive(items)
-            total = count_items_recursive(items)
-            flat_items = flatten_items(items)
+            stats = self._get_stats()
+            completed = stats["completed"]
+            total = stats["total"]
+            flat_items = self._get_flat_items(stats)
             
-            return {
+            return self._apply_attribute_mode({
                 "checklist_id": self.checklist_id,
                 "title": checklist.get("title", self._title),
                 "category": checklist.get("category", ""),
@@ -260,31 +273,33 @@ class JottyChecklistSensor(CoordinatorEntity, SensorEntity):
                 "completion_rate": round((completed / total * 100) if total > 0 else 0, 1),
                 "updated": checklist.get("updatedAt", ""),
                 "created": checklist.get("createdAt", ""),
-            }
-        return {
+            })
+        return self._apply_attribute_mode({
             "checklist_id": self.checklist_id,
             "title": self._title,
-            "category": "Home Assistant",
+            "category": self.coordinator.category_matcher.default_category,
             "items": [],
             "flat_items": [],
-        }
+        })
 
     @property
     def available(self):
         return self._get_checklist() is not None
 
     def _get_checklist(self):
-        ha_lists = self.coordinator.data.get("ha_checklists", [])
-        for checklist in ha_lists:
-            if checklist["id"] == self.checklist_id:
-                return checklist
-        return None
+        return self.coordinator.data.get("checklists_by_id", {}).get(self.checklist_id)
 
+    def _get_stats(self):
+        return self.coordinator.data.get("checklist_stats", {}).get(self.checklist_id)
 
-class JottyTaskSensor(CoordinatorEntity, SensorEntity):
 
-    def __init__(self, coordinator, task_id, title):
-        super().__init__(coordinator)
+class JottyTaskSensor(JottyDocumentSensor):
+
+    _document_kind = "tasks"
+    _unrecorded_attributes = frozenset({"items", "flat_items"})
+
+    def __init__(self, coordinator, task_id, title, attribute_mode=ATTRIBUTE_MODE_FULL):
+        super().__init__(coordinator, task_id, attribute_mode)
         self.task_id = task_id
         self._title = title
         self._attr_name = f"Jotty Task: {title}"
@@ -293,23 +308,12 @@ class JottyTaskSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        task = self._get_task()
-        if task:
-            items = task.get("items", [])
-            completed = self._count_by_status_recursive(items, "completed")
-            total = count_items_recursive(items)
-            return f"{completed}/{total}"
+        stats = self._get_stats()
+        if stats:
+            completed = stats["status_counts"].get("completed", 0)
+            return f"{completed}/{stats['total']}"
         return "0/0"
 
-    def _count_by_status_recursive(self, items, status):
-        count = 0
-        for item in items:
-            if item.get("status") == status:
-                count += 1
-            if item.get("children"):
-                count += self._count_by_status_recursive(item["children"], status)
-        return count
-
     @property
     def extra_state_attributes(self):
         task = self._get_task()
@@ -337,18 +341,20 @@ class JottyTaskSensor(CoordinatorEntity, SensorEntity):
                     {"id": "completed", "name": "Completed", "order": 2, "color": "#10b981"}
                 ]
             
-            todo = self._count_by_status_recursive(items, "todo")
-            in_progress = self._count_by_status_recursive(items, "in_progress")
-            completed = self._count_by_status_recursive(items, "completed")
-            total = count_items_recursive(items)
-            flat_items = flatten_items(items)
+            stats = self._get_stats()
+            counts = stats["status_counts"]
+            todo = counts.get("todo", 0)
+            in_progress = counts.get("in_progress", 0)
+            completed = counts.get("completed", 0)
+            total = stats["total"]
+            flat_items = self._get_flat_items(stats)
             
             status_counts = {}
             for status in statuses:
                 status_id = status.get("id") if isinstance(status, dict) else status
-                status_counts[status_id] = self._count_by_status_recursive(items, status_id)
+                status_counts[status_id] = counts.get(status_id, 0)
             
-            return {
+            return self._apply_attribute_mode({
                 "task_id": self.task_id,
                 "title": task.get("title", self._title),
                 "category": task.get("category", ""),
@@ -363,11 +369,11 @@ class JottyTaskSensor(CoordinatorEntity, SensorEntity):
                 "completion_rate": round((completed / total * 100) if total > 0 else 0, 1),
                 "updated": task.get("updatedAt", ""),
                 "created": task.get("createdAt", ""),
-            }
-        return {
+            })
+        return self._apply_attribute_mode({
             "task_id": self.task_id,
             "title": self._title,
-            "category": "Home Assistant",
+            "category": self.coordinator.category_matcher.default_category,
             "items": [],
             "flat_items": [],
             "statuses": [
@@ -375,15 +381,14 @@ class JottyTaskSensor(CoordinatorEntity, SensorEntity):
                 {"id": "in_progress", "name": "In Progress", "order": 1, "color": "#3b82f6"},
                 {"id": "completed", "name": "Completed", "order": 2, "color": "#10b981"}
             ],
-        }
+        })
 
     @property
     def available(self):
         return self._get_task() is not None
 
     def _get_task(self):
-        ha_tasks = self.coordinator.data.get("ha_tasks", [])
-        for task in ha_tasks:
-            if task["id"] == self.task_id:
-                return task
-        return None
\ No newline at end of file
+        return self.coordinator.data.get("tasks_by_id", {}).get(self.task_id)
+
+    def _get_stats(self):
+        return self.coordinator.data.get("task_stats", {}).get(self.task_id)
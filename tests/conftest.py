@@ -0,0 +1,67 @@
+"""Fixtures for the Jotty tests."""
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import CONF_API_KEY, CONF_URL
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.jotty.const import DOMAIN, HA_CATEGORY
+
+JOTTY_URL = "http://jotty.local"
+
+CHECKLIST = {
+    "id": "groceries",
+    "title": "Groceries",
+    "category": HA_CATEGORY,
+    "items": [
+        {"text": "Milk", "completed": False},
+        {"text": "Bread", "completed": True},
+    ],
+}
+NOTE = {"id": "ideas", "title": "Ideas", "category": HA_CATEGORY, "content": "More tests"}
+TASK = {
+    "id": "chores",
+    "title": "Chores",
+    "category": HA_CATEGORY,
+    "items": [{"id": "dishes", "text": "Dishes", "status": "todo"}],
+}
+
+# The four endpoints a full refresh reads, with the payload each one serves.
+JOTTY_API = {
+    "/api/summary": {"summary": {}},
+    "/api/checklists": {"checklists": [CHECKLIST]},
+    "/api/notes": {"notes": [NOTE]},
+    "/api/tasks": {"tasks": [TASK]},
+}
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load custom_components/jotty in every test."""
+    yield
+
+
+@pytest.fixture
+def config_entry(hass):
+    """A Jotty config entry with default options."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_URL: JOTTY_URL, CONF_API_KEY: "test-key"})
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def jotty_session(hass, aioclient_mock):
+    """Route the session the integration creates to aioclient_mock."""
+    with patch(
+        "custom_components.jotty._async_create_session",
+        side_effect=lambda: aioclient_mock.create_session(hass.loop),
+    ):
+        yield aioclient_mock
+
+
+@pytest.fixture
+def mock_jotty(jotty_session):
+    """Serve JOTTY_API from the mocked session."""
+    for path, payload in JOTTY_API.items():
+        jotty_session.get(f"{JOTTY_URL}{path}", json=payload)
+    return jotty_session
@@ -0,0 +1,172 @@
+"""Timing checks for the hot paths of a refresh.
+
+Run with ``pytest -m benchmark -s`` to see the measurements.
+"""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.jotty import JottyClient, JottyDataUpdateCoordinator
+from custom_components.jotty.const import HA_CATEGORY
+from custom_components.jotty.helpers import CategoryMatcher
+from custom_components.jotty.sensor import JottyChecklistSensor
+
+pytestmark = pytest.mark.benchmark
+
+JOTTY_URL = "http://jotty.local"
+
+
+def _checklists(count, items=5):
+    return [
+        {
+            "id": f"list-{index}",
+            "title": f"List {index}",
+            "category": HA_CATEGORY,
+            "items": [{"text": f"Item {item}", "completed": item % 2 == 0} for item in range(items)],
+        }
+        for index in range(count)
+    ]
+
+
+def _task_boards(boards, items):
+    return [
+        {
+            "id": f"board-{index}",
+            "title": f"Board {index}",
+            "category": HA_CATEGORY,
+            "items": [
+                {
+                    "id": f"item-{index}-{item}",
+                    "text": f"Item {item}",
+                    "status": ("todo", "in_progress", "completed")[item % 3],
+                    "children": [{"id": f"item-{index}-{item}-0", "text": "Subtask", "status": "todo"}],
+                }
+                for item in range(items // 2)
+            ],
+        }
+        for index in range(boards)
+    ]
+
+
+def _coordinator(hass):
+    return JottyDataUpdateCoordinator(hass, None, CategoryMatcher(), None)
+
+
+def _read_sensors(sensors):
+    """Read what Home Assistant reads when every sensor writes its state."""
+    start = time.perf_counter()
+    for sensor in sensors:
+        if sensor.available:
+            sensor.native_value
+            sensor.extra_state_attributes
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+async def test_sensor_lookup_per_refresh(hass, count):
+    coordinator = _coordinator(hass)
+    coordinator.data = coordinator._process_data({}, _checklists(count), [], [])
+    sensors = [JottyChecklistSensor(coordinator, f"list-{index}", f"List {index}") for index in range(count)]
+    # Warm up the flat item indexes, which both variants share.
+    _read_sensors(sensors)
+    indexed = _read_sensors(sensors)
+
+    # The same reads resolving each checklist with a scan of ha_checklists.
+    lists = coordinator.data["ha_checklists"]
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            JottyChecklistSensor,
+            "_get_checklist",
+            lambda self: next((c for c in lists if c["id"] == self.checklist_id), None),
+        )
+        scanned = _read_sensors(sensors)
+
+    print(f"{count} lists: indexed {indexed * 1000:.2f} ms, scanned {scanned * 1000:.2f} ms per refresh")
+    if count >= 1000:
+        assert indexed < scanned
+
+
+async def _longest_stall(work):
+    """Await work while ticking the event loop; return the longest gap between ticks."""
+    gaps = []
+    done = False
+
+    async def tick():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    await work()
+    done = True
+    await ticker
+    return max(gaps)
+
+
+async def test_event_loop_blocking_on_large_boards(hass):
+    tasks = _task_boards(200, 100)
+    # Every top level item carries one subtask.
+    assert sum(len(task["items"]) * 2 for task in tasks) == 20000
+
+    inline_coordinator = _coordinator(hass)
+
+    async def inline():
+        # The same processing run on the event loop, as before the executor pipeline.
+        computed = inline_coordinator._compute_stats(None, None, tasks, {}, {}, True)
+        inline_coordinator._process_data({}, [], [], tasks, computed)
+
+    executor_coordinator = _coordinator(hass)
+
+    async def executor():
+        await executor_coordinator._async_process_data({}, [], [], tasks)
+
+    inline_stall = await _longest_stall(inline)
+    executor_stall = await _longest_stall(executor)
+
+    print(f"20000 items: inline blocks {inline_stall * 1000:.1f} ms, executor {executor_stall * 1000:.1f} ms")
+    assert executor_stall < inline_stall
+
+
+def _best_of(runs, func, *args):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def test_response_body_is_read_and_decoded_once():
+    body = json.dumps({"checklists": _checklists(2000, items=10)}).encode()
+    response = MagicMock(spec=["status", "read", "raise_for_status"])
+    response.status = 200
+    response.read = AsyncMock(return_value=body)
+    client = JottyClient(None, JOTTY_URL, "test-key")
+
+    data = await client._handle_response(response, JOTTY_URL)
+
+    response.read.assert_awaited_once()
+    assert len(data["checklists"]) == 2000
+
+
+def test_decode_large_list_payload():
+    body = json.dumps({"checklists": _checklists(2000, items=10)}).encode()
+    client = JottyClient(None, JOTTY_URL, "test-key", document_filter=CategoryMatcher())
+
+    def stdlib():
+        # Before: response.text() and then response.json() on the same body.
+        json.loads(body.decode("utf-8"))
+        json.loads(body.decode("utf-8"))
+
+    decoded = _best_of(5, client._decode_documents, body, "checklists")
+    baseline = _best_of(5, stdlib)
+
+    print(f"{len(body) // 1024} KiB: single orjson decode {decoded * 1000:.1f} ms, stdlib twice {baseline * 1000:.1f} ms")
+    assert decoded < baseline
@@ -0,0 +1,43 @@
+"""Tests for the coordinator's incremental totals."""
+from custom_components.jotty import JottyDataUpdateCoordinator
+
+refresh_stats = JottyDataUpdateCoordinator._refresh_stats
+adjust_totals = JottyDataUpdateCoordinator._adjust_totals
+
+
+def _checklist(checklist_id, *completed):
+    return {"id": checklist_id, "items": [{"text": str(index), "completed": done} for index, done in enumerate(completed)]}
+
+
+def _totals(stats):
+    return {
+        "items": sum(entry[1]["total"] for entry in stats.values()),
+        "completed": sum(entry[1]["completed"] for entry in stats.values()),
+    }
+
+
+def test_totals_follow_added_changed_and_removed_documents():
+    totals = {"items": 0, "completed": 0}
+    first = refresh_stats([_checklist("a", True, False), _checklist("b", True)], {})
+    adjust_totals(totals, {}, first)
+    assert totals == {"items": 3, "completed": 2}
+
+    second = refresh_stats([_checklist("a", True, True, False), _checklist("c", False)], first)
+    adjust_totals(totals, first, second)
+    assert totals == {"items": 4, "completed": 2}
+    assert totals == _totals(second)
+
+
+def test_unchanged_documents_are_not_recounted():
+    documents = [_checklist("a", True, False), _checklist("b", False)]
+    previous = refresh_stats(documents, {})
+    current = refresh_stats(documents + [_checklist("c", True)], previous)
+    assert current["a"] is previous["a"]
+
+    # Seeded totals that do not match the entries show which ones were touched.
+    totals = {"items": 100, "completed": 50}
+    adjust_totals(totals, previous, current)
+    assert totals == {"items": 101, "completed": 51}
+
+    adjust_totals(totals, current, current)
+    assert totals == {"items": 101, "completed": 51}
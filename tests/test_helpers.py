@@ -0,0 +1,179 @@
+"""Tests for the item tree helpers."""
+import pytest
+
+from custom_components.jotty.const import HA_CATEGORY
+from custom_components.jotty.helpers import (
+    CategoryMatcher,
+    apply_item_mutation,
+    diff_items,
+    flatten_items,
+    split_categories,
+)
+
+
+def _document():
+    return {
+        "id": "a",
+        "title": "Chores",
+        "items": [
+            {"text": "Kitchen", "completed": False, "children": [
+                {"text": "Dishes", "completed": False, "children": []},
+                {"text": "Floor", "completed": True, "children": []},
+            ]},
+            {"text": "Garden", "completed": False, "children": [
+                {"text": "Mow", "completed": False, "children": []},
+            ]},
+        ],
+    }
+
+
+def test_mutation_copies_only_the_touched_path():
+    document = _document()
+
+    updated = apply_item_mutation(document, "check", "0.1")
+
+    assert updated["items"][0]["children"][1]["completed"] is True
+    assert updated["items"][0]["children"][0] is document["items"][0]["children"][0]
+    assert updated["items"][1] is document["items"][1]
+    assert document == _document()
+
+
+def test_check_uncheck_and_set_status():
+    document = _document()
+
+    assert apply_item_mutation(document, "check", "1")["items"][1]["completed"] is True
+    assert apply_item_mutation(document, "uncheck", "0.1")["items"][0]["children"][1]["completed"] is False
+    assert apply_item_mutation(document, "set_status", "1.0", status="done")["items"][1]["children"][0]["status"] == "done"
+
+
+def test_add_appends_to_the_parent_or_the_top_level():
+    document = _document()
+
+    nested = apply_item_mutation(document, "add", "1", text="Weed")
+    top = apply_item_mutation(document, "add", None, text="Laundry", status="todo")
+
+    assert nested["items"][1]["children"][-1] == {"text": "Weed", "completed": False, "children": []}
+    assert top["items"][-1] == {"text": "Laundry", "completed": False, "children": [], "status": "todo"}
+    assert document == _document()
+
+
+def test_delete_removes_the_item():
+    updated = apply_item_mutation(_document(), "delete", "0.0")
+
+    assert [item["text"] for item in updated["items"][0]["children"]] == ["Floor"]
+
+
+@pytest.mark.parametrize(
+    ("action", "index_path", "error"),
+    [
+        ("check", "0.5", IndexError),
+        ("delete", "3", IndexError),
+        ("add", "4", IndexError),
+        ("check", "x", ValueError),
+        ("rename", "0", ValueError),
+    ],
+)
+def test_invalid_mutations_raise(action, index_path, error):
+    with pytest.raises(error):
+        apply_item_mutation(_document(), action, index_path, text="New")
+
+
+def test_category_matcher_defaults_to_the_home_assistant_prefix():
+    matcher = CategoryMatcher()
+
+    assert matcher({"category": HA_CATEGORY})
+    assert matcher({"category": f"{HA_CATEGORY}/Kitchen"})
+    assert not matcher({"category": "Work"})
+    assert not matcher({})
+    assert matcher.default_category == HA_CATEGORY
+
+
+def test_category_matcher_names_exclusions_and_escaping():
+    matcher = CategoryMatcher(prefixes=["Home.Lists"], names=["Shopping"], exclude=["Home.Lists/Archive"])
+
+    assert matcher.matches("Home.Lists/Kitchen")
+    assert matcher.matches("Shopping")
+    assert not matcher.matches("Shopping/Old")
+    assert not matcher.matches("HomeXLists")
+    assert not matcher.matches("Home.Lists/Archive/2023")
+    assert matcher.server_categories == ["Home.Lists", "Shopping"]
+    assert matcher.default_category == "Home.Lists"
+
+
+def test_category_matcher_without_categories_matches_nothing():
+    matcher = CategoryMatcher(prefixes=[], names=[])
+
+    assert not matcher.matches(HA_CATEGORY)
+    assert not matcher.matches("")
+    assert matcher.default_category == HA_CATEGORY
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (" Home Assistant, ,Shopping ", ["Home Assistant", "Shopping"]),
+        (["Work ", ""], ["Work"]),
+        ("", []),
+        (None, []),
+    ],
+)
+def test_split_categories(value, expected):
+    assert split_categories(value) == expected
+
+
+def _changes(previous, current):
+    return [
+        (change["type"], change["id"] or change["index_path"])
+        for change in diff_items(flatten_items(previous), flatten_items(current))
+    ]
+
+
+def test_diff_reports_added_removed_and_status_changes():
+    previous = [
+        {"id": "milk", "text": "Milk", "completed": False},
+        {"id": "eggs", "text": "Eggs", "completed": False},
+    ]
+    current = [
+        {"id": "milk", "text": "Milk", "completed": True},
+        {"id": "bread", "text": "Bread", "completed": False},
+    ]
+
+    changes = diff_items(flatten_items(previous), flatten_items(current))
+
+    assert [(change["type"], change["id"]) for change in changes] == [
+        ("status_changed", "milk"),
+        ("added", "bread"),
+        ("removed", "eggs"),
+    ]
+    assert changes[0]["status"] == "completed"
+    assert changes[0]["previous_status"] == "pending"
+
+
+def test_diff_insert_or_removal_above_an_item_is_not_a_move():
+    items = [{"id": "b", "text": "B"}, {"id": "c", "text": "C"}]
+
+    assert _changes(items, [{"id": "a", "text": "A"}, *items]) == [("added", "a")]
+    assert _changes(items, items[1:]) == [("removed", "b")]
+
+
+def test_diff_reports_reorders_and_reparenting_as_moves():
+    todo = {"id": "todo", "text": "Todo", "children": [{"id": "x", "text": "X"}]}
+    done = {"id": "done", "text": "Done", "children": []}
+    y = {"id": "y", "text": "Y"}
+
+    assert _changes([todo, done, y], [done, todo, y]) == [("moved", "done"), ("moved", "todo")]
+    assert _changes([todo, done], [{**todo, "children": []}, {**done, "children": todo["children"]}]) == [
+        ("moved", "x")
+    ]
+
+
+def test_diff_matches_items_without_ids_by_index_path():
+    assert _changes([{"text": "A", "status": "todo"}], [{"text": "A", "status": "doing"}]) == [
+        ("status_changed", "0")
+    ]
+
+
+def test_insert_above_a_parent_without_id_is_not_a_move():
+    parent = {"text": "Kitchen", "children": [{"id": "dishes", "text": "Dishes"}]}
+
+    assert _changes([parent], [{"text": "Garden"}, parent]) == [("added", "1")]
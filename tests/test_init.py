@@ -0,0 +1,110 @@
+"""Tests for setting up a Jotty config entry."""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMockResponse
+
+from custom_components.jotty import STORAGE_VERSION
+from custom_components.jotty.const import DOMAIN
+
+from .conftest import CHECKLIST, JOTTY_API, JOTTY_URL, NOTE, TASK
+
+LATENCY = 0.2
+
+
+def _requests(aioclient_mock):
+    return sorted((method.upper(), str(url)) for method, url, _, _ in aioclient_mock.mock_calls)
+
+
+def _full_refresh():
+    return sorted(("GET", f"{JOTTY_URL}{path}") for path in JOTTY_API)
+
+
+def _store_snapshot(hass_storage, entry):
+    key = f"{DOMAIN}.{entry.entry_id}"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": key,
+        "data": {"summary": {}, "checklists": [CHECKLIST], "notes": [NOTE], "tasks": [TASK]},
+    }
+
+
+def _slow(payload):
+    async def respond(method, url, data):
+        await asyncio.sleep(LATENCY)
+        return AiohttpClientMockResponse(method, url, json=payload)
+
+    return respond
+
+
+async def test_cold_start_fetches_each_endpoint_once(hass, config_entry, mock_jotty):
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    # One refresh validates the connection and loads the data; no health check.
+    assert _requests(mock_jotty) == _full_refresh()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    assert coordinator.data["checklists_by_id"].keys() == {CHECKLIST["id"]}
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_restored_snapshot_starts_without_requests(hass, hass_storage, config_entry, mock_jotty):
+    _store_snapshot(hass_storage, config_entry)
+
+    with patch.object(config_entry, "async_create_background_task") as create_task:
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert mock_jotty.call_count == 0
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    assert coordinator.data["tasks_by_id"].keys() == {TASK["id"]}
+
+    # Jotty is only read by the refresh deferred until setup is done.
+    await create_task.call_args.args[1]
+    assert _requests(mock_jotty) == _full_refresh()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+@pytest.mark.benchmark
+async def test_cold_start_time(hass, config_entry, jotty_session):
+    for path, payload in JOTTY_API.items():
+        jotty_session.get(f"{JOTTY_URL}{path}", side_effect=_slow(payload))
+
+    start = time.perf_counter()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    print(f"cold start: {elapsed * 1000:.0f} ms with {LATENCY * 1000:.0f} ms per request")
+    # The endpoints are fetched concurrently and only once, so startup costs
+    # about one round trip rather than four.
+    assert elapsed < 2 * LATENCY
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+@pytest.mark.benchmark
+async def test_restored_start_time(hass, hass_storage, config_entry, jotty_session):
+    for path, payload in JOTTY_API.items():
+        jotty_session.get(f"{JOTTY_URL}{path}", side_effect=_slow(payload))
+    _store_snapshot(hass_storage, config_entry)
+
+    with patch.object(config_entry, "async_create_background_task") as create_task:
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - start
+
+    print(f"restored start: {elapsed * 1000:.0f} ms with {LATENCY * 1000:.0f} ms per request")
+    assert elapsed < LATENCY
+
+    create_task.call_args.args[1].close()
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,99 @@
+"""Tests for the coalescing mutation queue."""
+import asyncio
+
+from custom_components.jotty import JottyMutationQueue
+
+DELAY = 0.01
+COALESCED = {"success": True, "coalesced": True}
+
+
+def _queue(hass):
+    queue = JottyMutationQueue(hass, delay=DELAY)
+    drains = []
+    queue.on_drain = drains.append
+    return queue, drains
+
+
+async def _settle(hass):
+    await asyncio.sleep(DELAY * 5)
+    await hass.async_block_till_done()
+
+
+def _mutation(calls, name):
+    async def call():
+        calls.append(name)
+        return {"success": True, "name": name}
+
+    return call
+
+
+async def test_check_then_uncheck_cancels_out(hass):
+    queue, drains = _queue(hass)
+    calls = []
+    key = ("completed", "0")
+
+    results = await asyncio.gather(
+        queue.async_submit("checklists", "a", _mutation(calls, "check"), key=key, value=True, baseline=False),
+        queue.async_submit("checklists", "a", _mutation(calls, "uncheck"), key=key, value=False, baseline=True),
+    )
+    await _settle(hass)
+
+    assert calls == []
+    assert results == [COALESCED, COALESCED]
+    # The document is still reported so optimistic state gets reconciled.
+    assert drains == [{("checklists", "a")}]
+
+
+async def test_repeated_status_updates_keep_the_last(hass):
+    queue, drains = _queue(hass)
+    calls = []
+    key = ("status", "1")
+
+    results = await asyncio.gather(
+        *(
+            queue.async_submit("tasks", "b", _mutation(calls, status), key=key, value=status, baseline="todo")
+            for status in ("in_progress", "review", "completed")
+        )
+    )
+    await _settle(hass)
+
+    assert calls == ["completed"]
+    assert results == [COALESCED, COALESCED, {"success": True, "name": "completed"}]
+    assert drains == [{("tasks", "b")}]
+
+
+async def test_keyless_mutations_act_as_a_barrier(hass):
+    queue, _ = _queue(hass)
+    calls = []
+    key = ("completed", "0")
+
+    await asyncio.gather(
+        queue.async_submit("checklists", "a", _mutation(calls, "check"), key=key, value=True, baseline=False),
+        queue.async_submit("checklists", "a", _mutation(calls, "add")),
+        queue.async_submit("checklists", "a", _mutation(calls, "uncheck"), key=key, value=False, baseline=True),
+        queue.async_submit("checklists", "a", _mutation(calls, "delete")),
+        queue.async_submit("checklists", "a", _mutation(calls, "check again"), key=key, value=True, baseline=False),
+    )
+
+    # Adds and deletes shift index paths, so nothing coalesces across them.
+    assert calls == ["check", "add", "uncheck", "delete", "check again"]
+
+
+async def test_on_drain_fires_once_for_all_touched_documents(hass):
+    queue, drains = _queue(hass)
+    calls = []
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        queue.async_submit("checklists", "a", _mutation(calls, "add")),
+        queue.async_submit("tasks", "b", _mutation(calls, "add")),
+        queue.async_submit("tasks", "c", failing),
+        return_exceptions=True,
+    )
+    await _settle(hass)
+
+    assert isinstance(results[2], RuntimeError)
+    assert sorted(calls) == ["add", "add"]
+    assert drains == [{("checklists", "a"), ("tasks", "b"), ("tasks", "c")}]
@@ -0,0 +1,122 @@
+"""Tests for the debounced refresh scheduler."""
+import asyncio
+
+from custom_components.jotty import REFRESH_MAX_DOCUMENTS, JottyRefreshScheduler
+
+WINDOW = 0.05
+MAX_WAIT = 0.2
+
+
+class FakeCoordinator:
+    """Records every fetch together with the state it would have seen."""
+
+    def __init__(self):
+        self.version = 0
+        self.fetches = []
+
+    async def async_refresh_requested(self):
+        self.fetches.append(("full", self.version))
+
+    async def async_refresh_document(self, kind, document_id):
+        self.fetches.append((kind, document_id, self.version))
+
+
+def _scheduler(hass, coordinator):
+    return JottyRefreshScheduler(hass, coordinator, window=WINDOW, max_wait=MAX_WAIT)
+
+
+async def _settle(hass):
+    await asyncio.sleep(MAX_WAIT + WINDOW * 2)
+    await hass.async_block_till_done()
+
+
+async def test_single_request_fetches_on_leading_edge(hass):
+    coordinator = FakeCoordinator()
+    scheduler = _scheduler(hass, coordinator)
+
+    scheduler.async_schedule()
+    await hass.async_block_till_done()
+    assert coordinator.fetches == [("full", 0)]
+
+    await _settle(hass)
+    assert coordinator.fetches == [("full", 0)]
+    scheduler.async_shutdown()
+
+
+async def test_burst_yields_two_fetches_and_sees_final_state(hass):
+    coordinator = FakeCoordinator()
+    scheduler = _scheduler(hass, coordinator)
+
+    for _ in range(20):
+        coordinator.version += 1
+        scheduler.async_schedule()
+        await asyncio.sleep(0)
+
+    await _settle(hass)
+    assert len(coordinator.fetches) == 2
+    assert coordinator.fetches[-1] == ("full", coordinator.version)
+    scheduler.async_shutdown()
+
+
+async def test_trailing_fetch_is_capped_by_max_wait(hass):
+    coordinator = FakeCoordinator()
+    scheduler = _scheduler(hass, coordinator)
+
+    scheduler.async_schedule()
+    await hass.async_block_till_done()
+    start = hass.loop.time()
+    # Keep requesting faster than the window for well over max_wait.
+    while hass.loop.time() - start < MAX_WAIT * 2:
+        coordinator.version += 1
+        scheduler.async_schedule()
+        await asyncio.sleep(WINDOW / 4)
+
+    # Without the cap nothing would have fired since the leading edge.
+    assert len(coordinator.fetches) >= 2
+
+    await _settle(hass)
+    assert coordinator.fetches[-1] == ("full", coordinator.version)
+    scheduler.async_shutdown()
+
+
+async def test_document_requests_are_targeted(hass):
+    coordinator = FakeCoordinator()
+    scheduler = _scheduler(hass, coordinator)
+
+    scheduler.async_schedule("checklists", "a")
+    await hass.async_block_till_done()
+    scheduler.async_schedule("checklists", "b")
+    scheduler.async_schedule("checklists", "b")
+
+    await _settle(hass)
+    assert coordinator.fetches == [("checklists", "a", 0), ("checklists", "b", 0)]
+    scheduler.async_shutdown()
+
+
+async def test_too_many_documents_fall_back_to_full_refresh(hass):
+    coordinator = FakeCoordinator()
+    scheduler = _scheduler(hass, coordinator)
+
+    scheduler.async_schedule("tasks", "first")
+    await hass.async_block_till_done()
+    for index in range(REFRESH_MAX_DOCUMENTS + 1):
+        scheduler.async_schedule("tasks", str(index))
+
+    await _settle(hass)
+    assert coordinator.fetches == [("tasks", "first", 0), ("full", 0)]
+    scheduler.async_shutdown()
+
+
+async def test_shutdown_cancels_pending_refresh(hass):
+    coordinator = FakeCoordinator()
+    scheduler = _scheduler(hass, coordinator)
+
+    scheduler.async_schedule()
+    await hass.async_block_till_done()
+    scheduler.async_schedule()
+    scheduler.async_shutdown()
+
+    await _settle(hass)
+    scheduler.async_schedule()
+    await hass.async_block_till_done()
+    assert coordinator.fetches == [("full", 0)]
@@ -0,0 +1,95 @@
+"""Tests for push notifications received on the Jotty webhook."""
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import CONF_API_KEY, CONF_URL, CONF_WEBHOOK_ID
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.jotty.const import CONF_PUSH_ENABLED, DOMAIN
+
+from .conftest import JOTTY_URL
+
+WEBHOOK_ID = "jotty-test-hook"
+
+
+@pytest.fixture
+async def push_entry(hass, mock_jotty):
+    """A loaded entry with push updates enabled on WEBHOOK_ID."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_URL: JOTTY_URL, CONF_API_KEY: "test-key", CONF_WEBHOOK_ID: WEBHOOK_ID},
+        options={CONF_PUSH_ENABLED: True},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.fixture
+def push_calls(hass, push_entry):
+    """Capture the refreshes and removals a push notification asks for."""
+    entry_data = hass.data[DOMAIN][push_entry.entry_id]
+    with patch.object(entry_data["refresh_scheduler"], "async_schedule") as schedule, patch.object(
+        entry_data["coordinator"], "async_remove_document"
+    ) as remove:
+        yield schedule, remove
+
+
+async def _post(hass_client_no_auth, **kwargs):
+    client = await hass_client_no_auth()
+    response = await client.post(f"/api/webhook/{WEBHOOK_ID}", **kwargs)
+    assert response.status == 200
+
+
+@pytest.mark.parametrize(
+    ("payload", "target"),
+    [
+        ({"type": "checklist", "id": "groceries"}, ("checklists", "groceries")),
+        ({"type": "note", "id": "ideas"}, ("notes", "ideas")),
+        ({"type": "task", "id": "chores", "action": "updated"}, ("tasks", "chores")),
+        ({"event": "updated", "data": {"type": "Tasks", "id": "chores"}}, ("tasks", "chores")),
+    ],
+)
+async def test_typed_push_refreshes_one_document(hass_client_no_auth, push_calls, payload, target):
+    schedule, remove = push_calls
+
+    await _post(hass_client_no_auth, json=payload)
+
+    schedule.assert_called_once_with(*target)
+    remove.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"type": "checklist", "id": "groceries", "action": "deleted"},
+        {"data": {"type": "list", "id": "groceries", "event": "checklist.delete"}},
+    ],
+)
+async def test_delete_push_removes_document_locally(hass_client_no_auth, push_calls, payload):
+    schedule, remove = push_calls
+
+    await _post(hass_client_no_auth, json=payload)
+
+    remove.assert_called_once_with("checklists", "groceries")
+    schedule.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"data": "not json"},
+        {"json": ["groceries"]},
+        {"json": {"type": "folder", "id": "archive"}},
+        {"json": {"type": "note"}},
+    ],
+)
+async def test_unrecognised_push_refreshes_everything(hass_client_no_auth, push_calls, body):
+    schedule, remove = push_calls
+
+    await _post(hass_client_no_auth, **body)
+
+    schedule.assert_called_once_with()
+    remove.assert_not_called()